@@ -18,15 +18,20 @@ Usage:
     python setup.py --production   # Production deployment
     python setup.py --compliance   # Compliance validation
     python setup.py --security     # Security framework setup
+    python setup.py --dev --force  # Re-run every step, ignoring cached results
 """
 
 import argparse
+import hashlib
+import json
 import os
 import platform
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
 # ANSI color codes for terminal output
 class Colors:
@@ -39,6 +44,167 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
+    
+    @classmethod
+    def disable(cls) -> None:
+        """Blank every escape code, e.g. when output goes to a log file."""
+        for name in ('HEADER', 'OKBLUE', 'OKCYAN', 'OKGREEN', 'WARNING',
+                     'FAIL', 'ENDC', 'BOLD', 'UNDERLINE'):
+            setattr(cls, name, '')
+
+
+# Command-line tools probed by validate_system_requirements
+REQUIRED_TOOLS = ('git', 'docker')
+OPTIONAL_TOOLS = ('nvidia-smi', 'openssl')  # Optional but recommended
+
+# Project layout created by create_project_structure
+PROJECT_DIRECTORIES = (
+    'src/cv_cnc_manufacturing',
+    'src/cv_cnc_manufacturing/core',
+    'src/cv_cnc_manufacturing/computer_vision',
+    'src/cv_cnc_manufacturing/cnc_integration',
+    'src/cv_cnc_manufacturing/quality_control',
+    'src/cv_cnc_manufacturing/predictive_maintenance',
+    'src/cv_cnc_manufacturing/api',
+    'src/cv_cnc_manufacturing/security',
+    'src/cv_cnc_manufacturing/compliance',
+    'src/cv_cnc_manufacturing/utils',
+    'tests/unit',
+    'tests/integration',
+    'tests/performance',
+    'tests/security',
+    'tests/compliance',
+    'docs/source',
+    'docs/api',
+    'docs/architecture',
+    'configs',
+    'schemas',
+    'scripts',
+    'data/samples',
+    'data/models',
+    'data/calibration',
+    'logs',
+    'temp',
+    'certs',
+    'compliance_reports',
+)
+
+# Directories under these roots are Python packages and get an __init__.py
+PACKAGE_ROOTS = ('src/', 'tests/')
+PACKAGE_INIT = b'"""Package initialization."""\n'
+
+
+# Compliance templates written by SetupValidator, encoded once at import
+CERTS_README = """# Security Certificates
+
+This directory contains security certificates for industrial communication protocols.
+
+## Required Certificates:
+- OPC-UA Server Certificate
+- OPC-UA Client Certificate
+- TLS/SSL Certificates for API endpoints
+- Manufacturing network access certificates
+
+## Security Notes:
+- Never commit actual certificates to version control
+- Use environment-specific certificate management
+- Follow IEC 62443 certificate lifecycle management
+- Implement certificate rotation policies
+
+## Setup:
+1. Generate certificates using provided scripts
+2. Configure certificate validation
+3. Set up certificate monitoring
+4. Document certificate dependencies
+""".encode()
+
+EXPORT_CONTROL_TEMPLATE = """# Export Control Compliance Report
+
+## System Classification:
+- [ ] Dual-use technology assessment completed
+- [ ] Export control classification determined
+- [ ] End-user verification implemented
+- [ ] Geographic restriction compliance verified
+
+## Technical Controls:
+- [ ] Encryption algorithm compliance (FIPS 140-2)
+- [ ] Network security protocols validated
+- [ ] Data protection measures implemented
+- [ ] Access control systems verified
+
+## Documentation:
+- [ ] Technical specifications reviewed
+- [ ] User documentation sanitized
+- [ ] Training materials approved
+- [ ] Compliance monitoring implemented
+
+## Approval Status:
+- Review Date: [DATE]
+- Compliance Officer: [NAME]
+- Status: [PENDING/APPROVED/RESTRICTED]
+- Next Review: [DATE]
+""".encode()
+
+MANUFACTURING_STANDARDS_TEMPLATE = """# Manufacturing Standards Compliance
+
+## Quality Management (ISO 9001)
+- [ ] Quality management system documented
+- [ ] Process validation procedures implemented
+- [ ] Continuous improvement framework established
+- [ ] Customer satisfaction monitoring active
+
+## Automotive Quality (IATF 16949)
+- [ ] Risk-based thinking implemented
+- [ ] Error proofing measures in place
+- [ ] Statistical process control active
+- [ ] Supplier quality management verified
+
+## Industrial Cybersecurity (IEC 62443)
+- [ ] Security by design principles applied
+- [ ] Network segmentation implemented
+- [ ] Security incident response plan active
+- [ ] Vulnerability management program established
+
+## Manufacturing Integration
+- [ ] MTConnect compatibility verified
+- [ ] OPC-UA security compliance validated
+- [ ] Industrial network protocols secured
+- [ ] Safety instrumented systems integrated
+
+## Validation Status:
+- Last Updated: [DATE]
+- Standards Officer: [NAME]
+- Compliance Level: [BASIC/INTERMEDIATE/ADVANCED]
+- Certification Status: [PENDING/CERTIFIED/EXPIRED]
+""".encode()
+
+# Compliance files by path relative to the project root
+COMPLIANCE_TEMPLATES = {
+    'certs/README.md': CERTS_README,
+    'compliance_reports/export_control_template.md': EXPORT_CONTROL_TEMPLATE,
+    'MANUFACTURING_STANDARDS.md': MANUFACTURING_STANDARDS_TEMPLATE,
+}
+
+# Results of earlier successful setup steps, used to skip unchanged work
+SETUP_STATE_FILE = '.cv_cnc_setup_state.json'
+
+
+def _write_if_missing(path: Path, data: bytes) -> bool:
+    """Create ``path`` with ``data`` unless it already exists.
+    
+    O_EXCL folds the existence check into the open call, so an existing
+    file costs a single failed syscall and concurrent runs can't race.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return True
 
 
 class SetupValidator:
@@ -52,7 +218,52 @@ class SetupValidator:
             'arch': platform.machine(),
             'python_version': f"{self.python_version.major}.{self.python_version.minor}.{self.python_version.micro}"
         }
+        self.state_file = self.project_root / SETUP_STATE_FILE
+        
+        # Paths touched by the compliance checks, built once and shared
+        self.paths = {
+            'certs': self.project_root / 'certs',
+            'compliance': self.project_root / 'compliance_reports',
+            'standards': self.project_root / 'MANUFACTURING_STANDARDS.md',
+        }
+        self.compliance_files = {
+            relpath: self.project_root / relpath for relpath in COMPLIANCE_TEMPLATES
+        }
+        self.state = self._load_state()
+    
+    def _load_state(self) -> Dict:
+        """Load cached results of previous setup runs."""
+        try:
+            return json.loads(self.state_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state(self) -> None:
+        """Persist cached setup results for the next run."""
+        self.state_file.write_text(json.dumps(self.state, indent=2, sort_keys=True))
+        
+    def system_fingerprint(self) -> Dict:
+        """Summarise the interpreter, tool locations and project layout.
         
+        A match with the cached value means the Python, tool and directory
+        steps of the last successful setup would do nothing new.
+        """
+        tools = REQUIRED_TOOLS + OPTIONAL_TOOLS
+        # Each directory contributes whether it (and, for packages, its
+        # __init__.py) still exists, so a deleted one re-runs the mkdir step
+        manifest = []
+        for directory in sorted(PROJECT_DIRECTORIES):
+            dir_path = self.project_root / directory
+            present = dir_path.is_dir()
+            if present and directory.startswith(PACKAGE_ROOTS):
+                present = (dir_path / '__init__.py').is_file()
+            manifest.append(f"{directory}\0{int(present)}")
+        return {
+            'python': sys.version,
+            'tools': {tool: shutil.which(tool) for tool in tools},
+            'dir_manifest_hash': hashlib.sha256('\n'.join(manifest).encode()).hexdigest(),
+        }
+    
     def validate_python_version(self) -> bool:
         """Validate Python version meets requirements."""
         print(f"{Colors.OKBLUE}Validating Python version...{Colors.ENDC}")
@@ -68,27 +279,22 @@ class SetupValidator:
         """Validate system requirements for manufacturing platform."""
         print(f"{Colors.OKBLUE}Validating system requirements...{Colors.ENDC}")
         
-        requirements = {
-            'git': self._check_command('git --version'),
-            'docker': self._check_command('docker --version'),
-        }
-        
-        # Optional but recommended
-        optional = {
-            'nvidia-smi': self._check_command('nvidia-smi --version'),
-            'openssl': self._check_command('openssl version'),
-        }
+        # Probe every tool in one concurrent wave, then print in a fixed order
+        tools = REQUIRED_TOOLS + OPTIONAL_TOOLS
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            probes = {tool: executor.submit(self._check_command, tool) for tool in tools}
+        available = {tool: probe.result() for tool, probe in probes.items()}
         
         all_passed = True
-        for req, available in requirements.items():
-            if available:
+        for req in REQUIRED_TOOLS:
+            if available[req]:
                 print(f"{Colors.OKGREEN}✅ {req} - Available{Colors.ENDC}")
             else:
                 print(f"{Colors.FAIL}❌ {req} - Required but not found{Colors.ENDC}")
                 all_passed = False
         
-        for opt, available in optional.items():
-            if available:
+        for opt in OPTIONAL_TOOLS:
+            if available[opt]:
                 print(f"{Colors.OKGREEN}✅ {opt} - Available (optional){Colors.ENDC}")
             else:
                 print(f"{Colors.WARNING}⚠️  {opt} - Not found (optional){Colors.ENDC}")
@@ -96,89 +302,62 @@ class SetupValidator:
         return all_passed
     
     def _check_command(self, command: str) -> bool:
-        """Check if a command exists and is executable."""
-        try:
-            subprocess.run(
-                command.split(), 
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.DEVNULL,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if a command exists and is executable on PATH."""
+        return shutil.which(command) is not None
     
     def create_project_structure(self) -> bool:
         """Create the complete project directory structure."""
         print(f"{Colors.OKBLUE}Creating project structure...{Colors.ENDC}")
         
-        directories = [
-            'src/cv_cnc_manufacturing',
-            'src/cv_cnc_manufacturing/core',
-            'src/cv_cnc_manufacturing/computer_vision',
-            'src/cv_cnc_manufacturing/cnc_integration',
-            'src/cv_cnc_manufacturing/quality_control',
-            'src/cv_cnc_manufacturing/predictive_maintenance',
-            'src/cv_cnc_manufacturing/api',
-            'src/cv_cnc_manufacturing/security',
-            'src/cv_cnc_manufacturing/compliance',
-            'src/cv_cnc_manufacturing/utils',
-            'tests/unit',
-            'tests/integration',
-            'tests/performance',
-            'tests/security',
-            'tests/compliance',
-            'docs/source',
-            'docs/api',
-            'docs/architecture',
-            'configs',
-            'schemas',
-            'scripts',
-            'data/samples',
-            'data/models',
-            'data/calibration',
-            'logs',
-            'temp',
-            'certs',
-            'compliance_reports',
-        ]
-        
-        for directory in directories:
+        # Deepest paths first: mkdir(parents=True) on a leaf also creates its
+        # ancestors, so any directory already covered can skip the syscall
+        created = set()
+        for directory in sorted(PROJECT_DIRECTORIES, reverse=True):
             dir_path = self.project_root / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
+            if dir_path not in created:
+                dir_path.mkdir(parents=True, exist_ok=True)
+                created.update(dir_path.parents)
             
             # Create __init__.py for Python packages
-            if 'src/' in directory or 'tests/' in directory:
-                init_file = dir_path / '__init__.py'
-                if not init_file.exists():
-                    init_file.write_text('"""Package initialization."""\n')
+            if directory.startswith(PACKAGE_ROOTS):
+                _write_if_missing(dir_path / '__init__.py', PACKAGE_INIT)
         
         print(f"{Colors.OKGREEN}✅ Project structure created{Colors.ENDC}")
         return True
     
     def install_dependencies(self, env_type: str = 'dev') -> bool:
         """Install project dependencies based on environment type."""
-        print(f"{Colors.OKBLUE}Installing {env_type} dependencies...{Colors.ENDC}")
+        print(f"{Colors.OKBLUE}Installing {env_type} dependencies...{Colors.ENDC}", flush=True)
+        
+        extras = {
+            'dev': '[dev,test,docs]',
+            'production': '[security]',
+            'compliance': '[compliance,security]',
+        }.get(env_type, '')
+        
+        # Keep downloaded wheels in a project-local cache so repeat runs
+        # (fresh containers, CI) don't fetch and rebuild everything again
+        env = {
+            **os.environ,
+            'PIP_CACHE_DIR': str(self.project_root / '.cache' / 'pip'),
+            'PIP_DISABLE_PIP_VERSION_CHECK': '1',
+        }
+        
+        command = [
+            sys.executable, '-m', 'pip', 'install',
+            '--no-input', '--prefer-binary',
+            '-e', f'.{extras}'
+        ]
+        
+        # Pinned constraints skip most of the resolver's version search
+        constraints = self.project_root / 'constraints.lock'
+        if constraints.exists():
+            command.extend(['--constraint', str(constraints)])
         
         try:
-            # Install base dependencies
-            subprocess.run([
-                sys.executable, '-m', 'pip', 'install', '-e', '.'
-            ], check=True)
-            
-            # Install environment-specific dependencies
-            if env_type == 'dev':
-                subprocess.run([
-                    sys.executable, '-m', 'pip', 'install', '-e', '.[dev,test,docs]'
-                ], check=True)
-            elif env_type == 'production':
-                subprocess.run([
-                    sys.executable, '-m', 'pip', 'install', '-e', '.[security]'
-                ], check=True)
-            elif env_type == 'compliance':
-                subprocess.run([
-                    sys.executable, '-m', 'pip', 'install', '-e', '.[compliance,security]'
-                ], check=True)
+            # Installing with extras also installs the base package, so a
+            # single pip run covers both
+            subprocess.run(command, check=True, env=env)
             
             print(f"{Colors.OKGREEN}✅ Dependencies installed successfully{Colors.ENDC}")
             return True
@@ -189,181 +368,181 @@ class SetupValidator:
     
     def setup_pre_commit_hooks(self) -> bool:
         """Setup pre-commit hooks for code quality."""
-        print(f"{Colors.OKBLUE}Setting up pre-commit hooks...{Colors.ENDC}")
+        print(f"{Colors.OKBLUE}Setting up pre-commit hooks...{Colors.ENDC}", flush=True)
         
-        try:
-            # Install pre-commit hooks
-            subprocess.run([
-                sys.executable, '-m', 'pre_commit', 'install'
-            ], check=True)
-            
-            # Run initial check
-            subprocess.run([
-                sys.executable, '-m', 'pre_commit', 'run', '--all-files'
-            ], check=False)  # Don't fail if there are issues
-            
-            print(f"{Colors.OKGREEN}✅ Pre-commit hooks configured{Colors.ENDC}")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            print(f"{Colors.FAIL}❌ Pre-commit setup failed: {e}{Colors.ENDC}")
+        # Only a fresh install needs the full-tree pass; re-runs of setup just
+        # check what is staged
+        first_install = not (self.project_root / '.git' / 'hooks' / 'pre-commit').exists()
+        run_args = ['run', '--all-files'] if first_install else ['run']
+        
+        # Install pre-commit hooks
+        returncode = self._run_pre_commit(['install'])
+        if returncode != 0:
+            print(f"{Colors.FAIL}❌ Pre-commit setup failed: exit status {returncode}{Colors.ENDC}")
             return False
+        
+        # Run initial check; don't fail if there are issues
+        self._run_pre_commit(run_args)
+        
+        print(f"{Colors.OKGREEN}✅ Pre-commit hooks configured{Colors.ENDC}")
+        return True
+    
+    def _run_pre_commit(self, args: List[str]) -> int:
+        """Run a pre-commit command in-process, falling back to a subprocess."""
+        # Plain output skips pre-commit's colour post-processing
+        args = [*args, '--color', 'never']
+        try:
+            from pre_commit.main import main as pre_commit_main
+        except ImportError:
+            return subprocess.run([
+                sys.executable, '-m', 'pre_commit', *args
+            ], check=False).returncode
+        return pre_commit_main(args)
     
     def validate_manufacturing_compliance(self) -> bool:
         """Validate manufacturing compliance requirements."""
         print(f"{Colors.OKBLUE}Validating manufacturing compliance...{Colors.ENDC}")
         
-        compliance_checks = [
-            self._check_security_certificates(),
-            self._check_export_control_compliance(),
-            self._check_manufacturing_standards(),
-        ]
+        fingerprint = self._compliance_fingerprint()
+        if fingerprint is not None and self.state.get('compliance') == fingerprint:
+            print(f"{Colors.OKGREEN}✅ Manufacturing compliance unchanged - skipped{Colors.ENDC}")
+            return True
+        
+        checks = (
+            (self._check_security_certificates, "Security certificate framework initialized"),
+            (self._check_export_control_compliance, "Export control framework initialized"),
+            (self._check_manufacturing_standards, "Manufacturing standards framework initialized"),
+        )
+        
+        # The checks touch disjoint files, so run them together and report
+        # afterwards in a fixed order
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check, _ in checks]
+        
+        compliance_checks = []
+        for future, (_, message) in zip(futures, checks):
+            passed = future.result()
+            if passed:
+                print(f"{Colors.OKGREEN}✅ {message}{Colors.ENDC}")
+            compliance_checks.append(passed)
         
         if all(compliance_checks):
+            self.state['compliance'] = self._compliance_fingerprint()
+            self._save_state()
             print(f"{Colors.OKGREEN}✅ Manufacturing compliance validated{Colors.ENDC}")
             return True
         else:
             print(f"{Colors.WARNING}⚠️  Some compliance checks failed - Review required{Colors.ENDC}")
             return False
     
+    def _compliance_fingerprint(self) -> Optional[Dict]:
+        """Hash the compliance templates and stat the files written from them.
+        
+        Returns None when any file is missing, so a deleted file never
+        matches the cached state.
+        """
+        fingerprint = {'templates': {}, 'mtimes': {}}
+        for relpath, template in COMPLIANCE_TEMPLATES.items():
+            try:
+                mtime = self.compliance_files[relpath].stat().st_mtime_ns
+            except OSError:
+                return None
+            fingerprint['templates'][relpath] = hashlib.sha256(template).hexdigest()
+            fingerprint['mtimes'][relpath] = mtime
+        return fingerprint
+    
     def _check_security_certificates(self) -> bool:
         """Check security certificate configuration."""
-        cert_dir = self.project_root / 'certs'
-        if not cert_dir.exists():
-            cert_dir.mkdir(parents=True, exist_ok=True)
+        cert_dir = self.paths['certs']
+        cert_dir.mkdir(parents=True, exist_ok=True)
         
         # Create placeholder for certificate management
-        readme_file = cert_dir / 'README.md'
-        if not readme_file.exists():
-            readme_file.write_text("""# Security Certificates
-
-This directory contains security certificates for industrial communication protocols.
-
-## Required Certificates:
-- OPC-UA Server Certificate
-- OPC-UA Client Certificate
-- TLS/SSL Certificates for API endpoints
-- Manufacturing network access certificates
-
-## Security Notes:
-- Never commit actual certificates to version control
-- Use environment-specific certificate management
-- Follow IEC 62443 certificate lifecycle management
-- Implement certificate rotation policies
-
-## Setup:
-1. Generate certificates using provided scripts
-2. Configure certificate validation
-3. Set up certificate monitoring
-4. Document certificate dependencies
-""")
-        
-        print(f"{Colors.OKGREEN}✅ Security certificate framework initialized{Colors.ENDC}")
+        _write_if_missing(cert_dir / 'README.md', CERTS_README)
         return True
     
     def _check_export_control_compliance(self) -> bool:
         """Check export control compliance framework."""
-        compliance_dir = self.project_root / 'compliance_reports'
-        if not compliance_dir.exists():
-            compliance_dir.mkdir(parents=True, exist_ok=True)
+        compliance_dir = self.paths['compliance']
+        compliance_dir.mkdir(parents=True, exist_ok=True)
         
         # Create compliance tracking template
-        template_file = compliance_dir / 'export_control_template.md'
-        if not template_file.exists():
-            template_file.write_text("""# Export Control Compliance Report
-
-## System Classification:
-- [ ] Dual-use technology assessment completed
-- [ ] Export control classification determined
-- [ ] End-user verification implemented
-- [ ] Geographic restriction compliance verified
-
-## Technical Controls:
-- [ ] Encryption algorithm compliance (FIPS 140-2)
-- [ ] Network security protocols validated
-- [ ] Data protection measures implemented
-- [ ] Access control systems verified
-
-## Documentation:
-- [ ] Technical specifications reviewed
-- [ ] User documentation sanitized
-- [ ] Training materials approved
-- [ ] Compliance monitoring implemented
-
-## Approval Status:
-- Review Date: [DATE]
-- Compliance Officer: [NAME]
-- Status: [PENDING/APPROVED/RESTRICTED]
-- Next Review: [DATE]
-""")
-        
-        print(f"{Colors.OKGREEN}✅ Export control framework initialized{Colors.ENDC}")
+        _write_if_missing(compliance_dir / 'export_control_template.md', EXPORT_CONTROL_TEMPLATE)
         return True
     
     def _check_manufacturing_standards(self) -> bool:
         """Check manufacturing standards compliance."""
         # ISO 9001, IATF 16949, IEC 62443 compliance framework
-        standards_file = self.project_root / 'MANUFACTURING_STANDARDS.md'
-        if not standards_file.exists():
-            standards_file.write_text("""# Manufacturing Standards Compliance
-
-## Quality Management (ISO 9001)
-- [ ] Quality management system documented
-- [ ] Process validation procedures implemented
-- [ ] Continuous improvement framework established
-- [ ] Customer satisfaction monitoring active
-
-## Automotive Quality (IATF 16949)
-- [ ] Risk-based thinking implemented
-- [ ] Error proofing measures in place
-- [ ] Statistical process control active
-- [ ] Supplier quality management verified
-
-## Industrial Cybersecurity (IEC 62443)
-- [ ] Security by design principles applied
-- [ ] Network segmentation implemented
-- [ ] Security incident response plan active
-- [ ] Vulnerability management program established
-
-## Manufacturing Integration
-- [ ] MTConnect compatibility verified
-- [ ] OPC-UA security compliance validated
-- [ ] Industrial network protocols secured
-- [ ] Safety instrumented systems integrated
-
-## Validation Status:
-- Last Updated: [DATE]
-- Standards Officer: [NAME]
-- Compliance Level: [BASIC/INTERMEDIATE/ADVANCED]
-- Certification Status: [PENDING/CERTIFIED/EXPIRED]
-""")
-        
-        print(f"{Colors.OKGREEN}✅ Manufacturing standards framework initialized{Colors.ENDC}")
+        _write_if_missing(self.paths['standards'], MANUFACTURING_STANDARDS_TEMPLATE)
         return True
     
     def run_initial_tests(self) -> bool:
         """Run initial test suite to validate setup."""
-        print(f"{Colors.OKBLUE}Running initial test suite...{Colors.ENDC}")
+        print(f"{Colors.OKBLUE}Running initial test suite...{Colors.ENDC}", flush=True)
+        
+        tests_hash = self._test_inputs_hash()
+        if self.state.get('tests') == tests_hash:
+            print(f"{Colors.OKGREEN}✅ Tests, sources and dependencies unchanged since last passing run - skipped{Colors.ENDC}")
+            return True
+        
+        # Run unit tests
+        returncode = self._run_pytest(['tests/unit/', '-v', '--tb=short'])
+        
+        if returncode == 0:
+            self.state['tests'] = tests_hash
+            self._save_state()
+            print(f"{Colors.OKGREEN}✅ Initial tests passed{Colors.ENDC}")
+        else:
+            print(f"{Colors.WARNING}⚠️  Some tests failed (see output above) - This is normal for initial setup{Colors.ENDC}")
+        return True  # Don't fail setup for test failures
+    
+    def _test_inputs_hash(self) -> str:
+        """Hash everything a passing unit test run depends on.
+        
+        Covers the interpreter version, the test and source trees, and the
+        files that pin dependencies, so an upgrade or a source edit re-runs
+        the suite.
+        """
+        digest = hashlib.sha256(sys.version.encode())
+        for tree in ('tests/unit', 'src'):
+            digest.update(self._tree_hash(self.project_root / tree).encode())
+        
+        pinned = sorted(self.project_root.glob('requirements*.txt'))
+        pinned += [self.project_root / 'pyproject.toml', self.project_root / 'tests' / 'conftest.py']
+        for path in pinned:
+            if path.is_file():
+                digest.update(f"{path.name}\0".encode())
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _tree_hash(root: Path) -> str:
+        """Hash the path, mtime and size of every file under ``root``.
         
+        Only metadata is read, so this stays cheap for large test trees.
+        """
+        digest = hashlib.sha256()
+        files = (
+            path for path in root.rglob('*')
+            if path.is_file() and '__pycache__' not in path.parts
+        )
+        for path in sorted(files):
+            stat = path.stat()
+            digest.update(f"{path.relative_to(root).as_posix()}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+        return digest.hexdigest()
+    
+    def _run_pytest(self, args: List[str]) -> int:
+        """Run pytest in-process, falling back to a subprocess; return the exit code.
+        
+        Output streams straight to the terminal in both cases, so progress
+        is visible while the suite runs.
+        """
         try:
-            # Run unit tests
-            result = subprocess.run([
-                sys.executable, '-m', 'pytest', 
-                'tests/unit/', '-v', '--tb=short'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"{Colors.OKGREEN}✅ Initial tests passed{Colors.ENDC}")
-                return True
-            else:
-                print(f"{Colors.WARNING}⚠️  Some tests failed - This is normal for initial setup{Colors.ENDC}")
-                print(f"Test output:\n{result.stdout}")
-                return True  # Don't fail setup for test failures
-                
-        except subprocess.CalledProcessError as e:
-            print(f"{Colors.WARNING}⚠️  Test execution failed: {e}{Colors.ENDC}")
-            return True  # Don't fail setup for test execution issues
-
+            import pytest
+        except ImportError:
+            print(f"{Colors.WARNING}⚠️  pytest not importable - dev extras not installed, using a subprocess{Colors.ENDC}", flush=True)
+            return subprocess.run([sys.executable, '-m', 'pytest', *args], check=False).returncode
+        
+        return int(pytest.main(args))
 
 def main():
     """Main setup script entry point."""
@@ -390,9 +569,19 @@ def main():
         '--validate-only', action='store_true',
         help='Only run validation checks'
     )
+    parser.add_argument(
+        '--force', action='store_true',
+        help='Ignore cached results from previous setup runs'
+    )
     
     args = parser.parse_args()
     
+    # Escape codes are noise when piped to CI logs. A non-TTY stdout is also
+    # block-buffered, so prints batch into few writes; phases that hand the
+    # terminal to pip, pre-commit or pytest flush first to keep output ordered
+    if not sys.stdout.isatty() or 'NO_COLOR' in os.environ:
+        Colors.disable()
+    
     # Determine environment type
     if args.production:
         env_type = 'production'
@@ -412,12 +601,23 @@ def main():
     print()
     
     validator = SetupValidator()
+    if args.force:
+        validator.state.clear()
+    
+    # Python, tool and directory checks are skipped when nothing they look at
+    # has changed since the last successful setup
+    system_state = validator.system_fingerprint()
+    system_cached = validator.state.get('system') == system_state
     
     # Run validation checks
-    validation_results = [
-        validator.validate_python_version(),
-        validator.validate_system_requirements(),
-    ]
+    if system_cached:
+        print(f"{Colors.OKGREEN}✅ Python, system tools and project structure unchanged - skipped{Colors.ENDC}")
+        validation_results = [True]
+    else:
+        validation_results = [
+            validator.validate_python_version(),
+            validator.validate_system_requirements(),
+        ]
     
     if not all(validation_results):
         print(f"{Colors.FAIL}❌ Setup validation failed. Please resolve issues above.{Colors.ENDC}")
@@ -429,7 +629,7 @@ def main():
     
     # Run setup steps
     setup_results = [
-        validator.create_project_structure(),
+        system_cached or validator.create_project_structure(),
         validator.install_dependencies(env_type),
         validator.setup_pre_commit_hooks(),
         validator.validate_manufacturing_compliance(),
@@ -437,6 +637,8 @@ def main():
     ]
     
     if all(setup_results):
+        validator.state['system'] = system_state
+        validator._save_state()
         print(f"\n{Colors.OKGREEN}{Colors.BOLD}🎉 Setup completed successfully!{Colors.ENDC}")
         print(f"\n{Colors.OKBLUE}Next steps:{Colors.ENDC}")
         print(f"1. Review configuration files in configs/")
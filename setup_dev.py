@@ -6,9 +6,25 @@ This script sets up the development environment for testing and development
 
 import os
 import sys
+import socket
 import subprocess
 import platform
+from importlib.machinery import PathFinder
 from pathlib import Path
+from venv import EnvBuilder
+
+# Platform-specific virtual environment layout, resolved once at import
+IS_WINDOWS = platform.system() == "Windows"
+VENV_DIR = Path(".venv")
+VENV_BIN = VENV_DIR / ("Scripts" if IS_WINDOWS else "bin")
+PIP_EXE = VENV_BIN / ("pip.exe" if IS_WINDOWS else "pip")
+PY_EXE = VENV_BIN / ("python.exe" if IS_WINDOWS else "python")
+
+# How long a Docker daemon socket probe may take before giving up
+DOCKER_PROBE_TIMEOUT = 1.0
+
+# Packages test_installation expects in the venv
+REQUIRED_PACKAGES = ("fastapi", "uvicorn", "psycopg2", "redis", "pydantic")
 
 def print_header():
     """Print setup header"""
@@ -29,44 +45,45 @@ def check_python_version():
 
 def create_venv():
     """Create virtual environment"""
-    venv_path = Path(".venv")
-    
-    if venv_path.exists():
+    if VENV_DIR.exists():
         print("✅ Virtual environment already exists")
         return True
     
     print("📦 Creating virtual environment...")
+    # Build in-process rather than spawning "python -m venv"; on 3.9+ the
+    # pip upgrade is folded into creation via upgrade_deps
+    builder = EnvBuilder(
+        with_pip=True,
+        symlinks=not IS_WINDOWS,
+        upgrade_deps=sys.version_info >= (3, 9),
+    )
     try:
-        subprocess.run([sys.executable, "-m", "venv", ".venv"], check=True)
+        builder.create(VENV_DIR)
         print("✅ Virtual environment created successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"❌ Failed to create virtual environment: {e}")
         return False
 
 def get_activation_command():
     """Get the command to activate virtual environment"""
-    if platform.system() == "Windows":
-        return ".venv\\Scripts\\activate"
-    else:
-        return "source .venv/bin/activate"
+    if IS_WINDOWS:
+        return str(VENV_BIN / "activate")
+    return f"source {VENV_BIN / 'activate'}"
 
 def install_packages():
     """Install required packages"""
     print("📥 Installing packages...")
     
-    # Determine the pip executable
-    if platform.system() == "Windows":
-        pip_exe = ".venv\\Scripts\\pip.exe"
-    else:
-        pip_exe = ".venv/bin/pip"
+    command = [PIP_EXE, "install", "--disable-pip-version-check", "-r", "requirements-minimal.txt"]
+    
+    # create_venv already upgrades pip on 3.9+; older Pythons upgrade it in
+    # the same run as the requirements
+    if sys.version_info < (3, 9):
+        command[2:2] = ["--upgrade", "pip"]
     
     try:
-        # Upgrade pip first
-        subprocess.run([pip_exe, "install", "--upgrade", "pip"], check=True)
-        
-        # Install minimal requirements
-        subprocess.run([pip_exe, "install", "-r", "requirements-minimal.txt"], check=True)
+        subprocess.run(command, check=True)
         
         print("✅ Packages installed successfully")
         return True
@@ -74,37 +91,93 @@ def install_packages():
         print(f"❌ Failed to install packages: {e}")
         return False
 
+def venv_site_packages():
+    """Locate the venv's site-packages directory.
+    
+    On POSIX the directory is named after the Python that created the venv,
+    which is not necessarily the one running this script when .venv already
+    existed; take the version from pyvenv.cfg, then fall back to a glob.
+    """
+    if IS_WINDOWS:
+        return VENV_DIR / "Lib" / "site-packages"
+    
+    lib_dir = VENV_DIR / "lib"
+    try:
+        for line in (VENV_DIR / "pyvenv.cfg").read_text().splitlines():
+            key, _, value = line.partition("=")
+            if key.strip() in ("version", "version_info"):
+                major_minor = ".".join(value.strip().split(".")[:2])
+                candidate = lib_dir / f"python{major_minor}" / "site-packages"
+                if candidate.is_dir():
+                    return candidate
+    except OSError:
+        pass
+    
+    found = sorted(lib_dir.glob("python*/site-packages"))
+    if found:
+        return found[-1]
+    return lib_dir / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+
 def test_installation():
     """Test the installation"""
     print("🧪 Testing installation...")
     
-    # Determine the python executable
-    if platform.system() == "Windows":
-        python_exe = ".venv\\Scripts\\python.exe"
-    else:
-        python_exe = ".venv/bin/python"
+    # Search the venv's site-packages directly instead of spawning the
+    # venv's python to import each package
+    site_packages = str(venv_site_packages())
+    missing = [
+        name for name in REQUIRED_PACKAGES
+        if PathFinder.find_spec(name, [site_packages]) is None
+    ]
+    if missing:
+        print(f"❌ Package test failed: missing {', '.join(missing)}")
+        return False
+    print("✅ All essential packages found in the virtual environment")
+    return True
+
+def docker_endpoints():
+    """Candidate Docker daemon endpoints, as DOCKER_HOST-style URLs"""
+    if os.environ.get("DOCKER_HOST"):
+        return [os.environ["DOCKER_HOST"]]
+    if IS_WINDOWS:
+        return ["npipe:////./pipe/docker_engine"]
     
+    # System daemon, rootless daemon, then Docker Desktop's per-user socket
+    endpoints = ["unix:///var/run/docker.sock"]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        endpoints.append(f"unix://{os.environ['XDG_RUNTIME_DIR']}/docker.sock")
+    endpoints.append(f"unix://{Path.home() / '.docker' / 'run' / 'docker.sock'}")
+    return endpoints
+
+def probe_docker_endpoint(endpoint):
+    """Return True if a daemon accepts connections at the endpoint"""
+    scheme, _, address = endpoint.partition("://")
     try:
-        # Test imports
-        test_script = """
-import fastapi
-import uvicorn
-import psycopg2
-import redis
-import pydantic
-print("✅ All essential packages imported successfully")
-"""
-        result = subprocess.run([python_exe, "-c", test_script], 
-                              capture_output=True, text=True, check=True)
-        print(result.stdout.strip())
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Package test failed: {e}")
-        print(f"Error output: {e.stderr}")
-        return False
+        if scheme == "unix" and hasattr(socket, "AF_UNIX"):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(DOCKER_PROBE_TIMEOUT)
+                sock.connect(address)
+            return True
+        if scheme == "tcp":
+            host, _, port = address.rstrip("/").rpartition(":")
+            with socket.create_connection((host, int(port)), timeout=DOCKER_PROBE_TIMEOUT):
+                return True
+        if scheme == "npipe":
+            # Named pipes cannot be opened with socket; existence is the probe
+            return os.path.exists(address.replace("/", "\\"))
+    except (OSError, ValueError):
+        pass
+    # ssh:// and other transports are left to the CLI
+    return False
 
 def check_docker():
     """Check if Docker is available"""
+    # A daemon answering on its socket settles it without spawning the CLI
+    for endpoint in docker_endpoints():
+        if probe_docker_endpoint(endpoint):
+            print(f"✅ Docker available: daemon reachable at {endpoint}")
+            return True
+    
     try:
         result = subprocess.run(["docker", "--version"], 
                               capture_output=True, text=True, check=True)
@@ -9,10 +9,20 @@ License: MIT with Manufacturing Disclaimers
 Author: Computer Vision CNC Platform Team
 """
 
+import atexit
+import functools
+import importlib
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import signal
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 # Version information
 __version__ = "1.0.0"
@@ -35,33 +45,212 @@ __compliance_standards__ = [
     "NIST Cybersecurity Framework"
 ]
 
+_COMPLIANCE_JOINED = ", ".join(__compliance_standards__)
+
 __export_control__ = "EAR99"
 __safety_rating__ = "Category 3 (EN ISO 13849-1)"
 
+# Platform information is constant, so it is built once and shared read-only
+_PLATFORM_INFO = MappingProxyType({
+    "name": __platform_name__,
+    "version": __version__,
+    "description": __platform_description__,
+    "author": __author__,
+    "license": __license__,
+    "compliance_standards": tuple(__compliance_standards__),
+    "export_control": __export_control__,
+    "safety_rating": __safety_rating__,
+    "url": __platform_url__
+})
+
+# Pre-encoded for API responses that serve platform information verbatim
+_PLATFORM_INFO_JSON = json.dumps(dict(_PLATFORM_INFO), separators=(",", ":")).encode("utf-8")
+
+# Import-time side effects run once per process, even if the module is
+# reloaded, so handlers are never registered twice
+_INITIALIZED = globals().get("_INITIALIZED", False)
+
 # Logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('cv_cnc_manufacturing.log')
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = 'cv_cnc_manufacturing.log'
+
+# Accepted initialize_platform() log levels, resolved once
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler bound to whatever ``sys.stdout`` is when a record is emitted.
+    
+    Mirrors logging's own last-resort stderr handler, so redirected stdout
+    (pytest capture, notebooks, daemonized workers) is honoured rather than
+    the stream that happened to be installed at import time.
+    """
+    
+    def __init__(self) -> None:
+        super().__init__()
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value) -> None:
+        pass  # Always resolved from sys.stdout
+
+# Root handlers are wired directly instead of through basicConfig(), which
+# silently does nothing if another import configured logging first
+if not _INITIALIZED:
+    _root_logger = logging.getLogger()
+    _root_logger.setLevel(logging.INFO)
+    _stream_handler = _StdoutHandler()
+    _stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _root_logger.addHandler(_stream_handler)
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that writes through a 128 KB buffer without per-record flushes.
+    
+    Flushing is left to the ``_BatchingMemoryHandler`` in front of it, so a
+    batch of records reaches the disk in a handful of large writes.
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=131072,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+class _BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target once per drained batch."""
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            super().flush()
+            if self.target is not None:
+                self.target.flush()
+        finally:
+            self.release()
+
+# Installed by initialize_platform(); kept across reloads like _INITIALIZED
+_file_log_handler: Optional[logging.Handler] = globals().get("_file_log_handler")
+
+def _install_file_logging(
+    path: str = LOG_FILE,
+    capacity: int = 512,
+    flush_level: int = logging.ERROR
+) -> logging.Handler:
+    """Attach the platform log file to the root logger, batching writes."""
+    global _file_log_handler
+    if _file_log_handler is not None:
+        return _file_log_handler
+    
+    file_handler = _BufferedFileHandler(path, encoding="utf-8", delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    memory_handler = _BatchingMemoryHandler(
+        capacity, flushLevel=flush_level, target=file_handler
+    )
+    logging.getLogger().addHandler(memory_handler)
+    atexit.register(_flush_logs)
+    
+    _file_log_handler = memory_handler
+    return memory_handler
+
+# Started by initialize_platform(); kept across reloads like _INITIALIZED
+_log_listener: Optional[logging.handlers.QueueListener] = globals().get("_log_listener")
+
+def _start_log_listener() -> None:
+    """Move the platform's log handlers behind a queue.
+    
+    Logging threads then only enqueue records, and a single background
+    thread performs the stream and file writes.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    root = logging.getLogger()
+    handlers = [
+        handler for handler in (globals().get("_stream_handler"), _file_log_handler)
+        if handler is not None and handler in root.handlers
     ]
-)
+    for handler in handlers:
+        root.removeHandler(handler)
+    
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+
+def _flush_logs() -> None:
+    """Drain the log queue, then flush and close the buffered file handlers.
+    
+    Runs at interpreter exit (including after SIGTERM, see
+    ``_install_sigterm_handler``) so batched records are not lost.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    
+    if _file_log_handler is not None:
+        file_handler = _file_log_handler.target
+        _file_log_handler.close()  # Flushes the batch into file_handler
+        if file_handler is not None:
+            file_handler.close()
+
+def _install_sigterm_handler() -> None:
+    """Turn SIGTERM into a normal interpreter exit so atexit hooks flush logs.
+    
+    Only installed from the main thread and when no other handler has been
+    set, so servers that manage their own signals are left alone.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+    
+    def _exit_on_sigterm(signum, frame):
+        raise SystemExit(128 + signum)
+    
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
 # Package logger
 logger = logging.getLogger(__name__)
 
-# Platform directories
-PACKAGE_ROOT = Path(__file__).parent
-PROJECT_ROOT = PACKAGE_ROOT.parent.parent
+# Platform directories (resolved with os.path string ops, then wrapped once)
+_PACKAGE_ROOT_STR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_ROOT = Path(_PACKAGE_ROOT_STR)
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(_PACKAGE_ROOT_STR)))
 CONFIG_DIR = PROJECT_ROOT / "configs"
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
 CERTS_DIR = PROJECT_ROOT / "certs"
 
-# Ensure required directories exist
-for directory in [DATA_DIR, LOGS_DIR, CERTS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Directories created on initialization, and all those checked afterwards;
+# each is a direct child of PROJECT_ROOT so one scandir covers them
+_CREATED_DIRS = (DATA_DIR, LOGS_DIR, CERTS_DIR)
+_VALIDATED_DIRS = (CONFIG_DIR, *_CREATED_DIRS)
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create ``path`` if needed; repeat calls are an in-process lookup."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+_INITIALIZED = True
 
 # Manufacturing safety notice
 SAFETY_NOTICE = """
@@ -93,6 +282,9 @@ Users are responsible for compliance with applicable laws.
 - Contact legal@cv-cnc-platform.com for guidance
 """
 
+# Both notices as one string, written with a single call on initialization
+_COMBINED_NOTICES = SAFETY_NOTICE + "\n" + EXPORT_CONTROL_NOTICE + "\n"
+
 def get_version() -> str:
     """Get the current version string."""
     return __version__
@@ -101,27 +293,30 @@ def get_version_info() -> tuple:
     """Get version information as tuple."""
     return __version_info__
 
-def get_platform_info() -> dict:
-    """Get comprehensive platform information."""
-    return {
-        "name": __platform_name__,
-        "version": __version__,
-        "description": __platform_description__,
-        "author": __author__,
-        "license": __license__,
-        "compliance_standards": __compliance_standards__,
-        "export_control": __export_control__,
-        "safety_rating": __safety_rating__,
-        "url": __platform_url__
-    }
+def get_platform_info() -> Mapping[str, Any]:
+    """Get comprehensive platform information (read-only)."""
+    return _PLATFORM_INFO
+
+def get_platform_info_json() -> bytes:
+    """Get platform information as pre-serialized UTF-8 JSON."""
+    return _PLATFORM_INFO_JSON
+
+def _write_notice(text: str, label: str) -> None:
+    """Write a notice to an interactive terminal; log a pointer otherwise."""
+    # Headless deployments (services, containers, CI) would only push the
+    # banner text into their logs on every start
+    if sys.stdout.isatty():
+        sys.stdout.write(text)
+    else:
+        logger.info("%s suppressed for non-interactive output; see %s", label, __platform_url__)
 
 def print_safety_notice() -> None:
     """Print manufacturing safety notice."""
-    print(SAFETY_NOTICE)
+    _write_notice(SAFETY_NOTICE + "\n", "Safety notice")
 
 def print_export_control_notice() -> None:
     """Print export control notice."""
-    print(EXPORT_CONTROL_NOTICE)
+    _write_notice(EXPORT_CONTROL_NOTICE + "\n", "Export control notice")
 
 def initialize_platform(
     config_path: Optional[Path] = None,
@@ -136,32 +331,42 @@ def initialize_platform(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         show_notices: Whether to display safety and compliance notices
     """
+    # Module constants used more than once below, bound as fast locals
+    name = __platform_name__
+    version = __version__
+    
     # Set logging level
-    logging.getLogger().setLevel(getattr(logging, log_level.upper()))
+    logging.getLogger().setLevel(_LEVELS.get(log_level.upper(), logging.INFO))
+    _install_file_logging()
+    _start_log_listener()
+    _install_sigterm_handler()
     
-    logger.info(f"Initializing {__platform_name__} v{__version__}")
+    logger.info("Initializing %s v%s", name, version)
     
     # Display notices for manufacturing safety
     if show_notices:
-        print_safety_notice()
-        print_export_control_notice()
+        _write_notice(_COMBINED_NOTICES, "Safety and export control notices")
     
     # Log platform information
-    logger.info(f"Platform: {__platform_name__}")
-    logger.info(f"Version: {__version__}")
-    logger.info(f"Compliance: {', '.join(__compliance_standards__)}")
-    logger.info(f"Export Control: {__export_control__}")
-    logger.info(f"Safety Rating: {__safety_rating__}")
+    logger.info("Platform: %s", name)
+    logger.info("Version: %s", version)
+    logger.info("Compliance: %s", _COMPLIANCE_JOINED)
+    logger.info("Export Control: %s", __export_control__)
+    logger.info("Safety Rating: %s", __safety_rating__)
     
     # Validate environment
     _validate_environment()
     
     logger.info("Platform initialization completed successfully")
 
+@functools.lru_cache(maxsize=1)
+def _system_info() -> tuple:
+    """Return (system, release, machine); fixed for the life of the process."""
+    import platform as py_platform
+    return py_platform.system(), py_platform.release(), py_platform.machine()
+
 def _validate_environment() -> None:
     """Validate the runtime environment for manufacturing requirements."""
-    import platform as py_platform
-    
     # Check Python version
     if sys.version_info < (3, 8):
         raise RuntimeError(
@@ -170,134 +375,90 @@ def _validate_environment() -> None:
         )
     
     # Log system information
-    logger.info(f"Python: {sys.version}")
-    logger.info(f"Platform: {py_platform.system()} {py_platform.release()}")
-    logger.info(f"Architecture: {py_platform.machine()}")
-    
-    # Check required directories
-    for directory in [CONFIG_DIR, DATA_DIR, LOGS_DIR, CERTS_DIR]:
-        if not directory.exists():
-            logger.warning(f"Directory does not exist: {directory}")
-        else:
-            logger.debug(f"Directory validated: {directory}")
-
-# Module imports for easy access
-try:
-    # Import core base classes and exceptions
-    from .core.base import (
-        BaseManufacturingComponent,
-        BaseAsyncComponent,
-        OperationResult,
-        ComponentState,
-        ManufacturingException,
-        SafetyException,
-        QualityException,
-        safety_context
-    )
+    logger.info("Python: %s", sys.version)
+    system, release, machine = _system_info()
+    logger.info("Platform: %s %s", system, release)
+    logger.info("Architecture: %s", machine)
     
-    # Import computer vision components
-    from .computer_vision import (
-        ImageProcessor,
-        DefectDetector,
-        QualityInspector,
-        InspectionResult,
-        DefectDetection,
-        DefectType,
-        QualityMetrics
-    )
+    # Ensure required directories exist
+    for directory in _CREATED_DIRS:
+        _ensure_dir(directory)
     
-    # Import CNC integration components
-    from .cnc import (
-        CNCManager,
-        CNCController,
-        MTConnectController,
-        OPCUAController,
-        MachineState,
-        MachineStatus,
-        ToolStatus,
-        AxisPosition
-    )
+    # Check required directories with one read of the project root
+    with os.scandir(PROJECT_ROOT) as entries:
+        present = {entry.name for entry in entries if entry.is_dir()}
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    for directory in _VALIDATED_DIRS:
+        if directory.name not in present:
+            logger.warning("Directory does not exist: %s", directory)
+        elif debug_enabled:
+            logger.debug("Directory validated: %s", directory)
+
+# Public components are imported from their submodules on first access
+# (PEP 562), so importing the package doesn't load the vision, CNC and API
+# stacks for callers that only need version or platform information
+_LAZY_IMPORTS = {
+    # Core base classes and exceptions
+    "BaseManufacturingComponent": ".core.base",
+    "BaseAsyncComponent": ".core.base",
+    "OperationResult": ".core.base",
+    "ComponentState": ".core.base",
+    "ManufacturingException": ".core.base",
+    "SafetyException": ".core.base",
+    "QualityException": ".core.base",
+    "safety_context": ".core.base",
     
-    # Import API components
-    from .api import (
-        ManufacturingAPI,
-        create_api_server,
-        run_api_server,
-        APIConfig
-    )
+    # Computer vision components
+    "ImageProcessor": ".computer_vision",
+    "DefectDetector": ".computer_vision",
+    "QualityInspector": ".computer_vision",
+    "InspectionResult": ".computer_vision",
+    "DefectDetection": ".computer_vision",
+    "DefectType": ".computer_vision",
     
-    # Import development environment tools
-    from .development import (
-        DevelopmentEnvironment,
-        validate_dev_environment,
-        setup_development_environment,
-        create_vscode_config
-    )
+    # CNC integration components
+    "CNCManager": ".cnc",
+    "CNCController": ".cnc",
+    "MTConnectController": ".cnc",
+    "OPCUAController": ".cnc",
+    "ModbusController": ".cnc",
+    "MachineState": ".cnc",
+    "MachineStatus": ".cnc",
+    "AxisPosition": ".cnc",
+    "AxisPositions": ".cnc",
     
-    logger.debug("All platform modules imported successfully")
-    
-    # Only add successfully imported components to __all__
-    # Core components that we know exist
-    __all__ += [
-        "BaseManufacturingComponent",
-        "BaseAsyncComponent", 
-        "OperationResult",
-        "ComponentState",
-        "ManufacturingException",
-        "SafetyException",
-        "QualityException",
-        "safety_context",
-    ]
+    # API components
+    "ManufacturingAPI": ".api",
+    "create_api_server": ".api",
+    "run_api_server": ".api",
+    "APIConfig": ".api",
     
-    # Conditionally add components that were successfully imported
-    try:
-        if 'QualityInspector' in globals():
-            __all__ += [
-                "QualityInspector",
-                "DefectDetector",
-                "ImageProcessor", 
-                "InspectionResult",
-                "DefectDetection",
-                "DefectType"
-            ]
-    except: pass
-    
-    try:
-        if 'CNCManager' in globals():
-            __all__ += [
-                "CNCManager",
-                "CNCController",
-                "MTConnectController",
-                "OPCUAController",
-                "MachineState", 
-                "MachineStatus",
-                "AxisPosition"
-            ]
-    except: pass
-    
-    try:
-        if 'ManufacturingAPI' in globals():
-            __all__ += [
-                "ManufacturingAPI",
-                "create_api_server",
-                "run_api_server",
-                "APIConfig"
-            ]
-    except: pass
-    
-    try:
-        if 'DevelopmentEnvironment' in globals():
-            __all__ += [
-                "DevelopmentEnvironment",
-                "validate_dev_environment",
-                "setup_development_environment"
-            ]
-    except: pass
-    
-except ImportError as e:
-    logger.warning(f"Some platform modules could not be imported: {e}")
-    logger.info("This is normal during initial setup or testing")
-    logger.debug(f"Import error details: {str(e)}")
+    # Development environment tools
+    "DevelopmentEnvironment": ".development",
+    "validate_dev_environment": ".development",
+    "setup_development_environment": ".development",
+}
+
+# Subpackages reachable as attributes (``cv_cnc_manufacturing.cnc``) without
+# an explicit submodule import
+_LAZY_SUBMODULES = ("core", "computer_vision", "cnc", "api", "development")
+
+def __getattr__(name: str):
+    """Import a public component or subpackage on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+def __dir__():
+    """Include lazily imported components in dir() and tab completion."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_SUBMODULES))
 
 # Update platform metadata to reflect architecture completion
 __manufacturing_metadata__ = {
@@ -313,8 +474,9 @@ __manufacturing_metadata__ = {
     "production_ready": False  # Requires full validation
 }
 
-# Platform metadata for setuptools
-__all__ = [
+# Platform metadata for setuptools; declared once, including the lazily
+# imported components, so star-imports and tooling see a fixed export list
+__all__ = (
     # Version information
     "__version__",
     "__version_info__", 
@@ -335,6 +497,7 @@ __all__ = [
     "get_version",
     "get_version_info", 
     "get_platform_info",
+    "get_platform_info_json",
     "print_safety_notice",
     "print_export_control_notice",
     "initialize_platform",
@@ -353,5 +516,8 @@ __all__ = [
     "logger",
     
     # Manufacturing metadata
-    "__manufacturing_metadata__"
-]
+    "__manufacturing_metadata__",
+    
+    # Lazily imported components
+    *_LAZY_IMPORTS,
+)
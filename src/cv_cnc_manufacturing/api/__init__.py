@@ -9,18 +9,27 @@ implement proper authentication, authorization, and safety validation.
 """
 
 import asyncio
+import binascii
+import functools
 import json
+import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Union
 from uuid import UUID, uuid4
 
 try:
-    from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket
+    from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket, File, Form, UploadFile
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+    from fastapi.encoders import jsonable_encoder
     from fastapi.responses import JSONResponse
+    from ..core.responses import ORJSON_OPTIONS, ORJSONResponse
     from pydantic import BaseModel, Field, validator
     import uvicorn
     HAS_FASTAPI = True
@@ -48,11 +57,80 @@ except ImportError:
     
     def Field(default=None, **kwargs): return default
     def Depends(*args, **kwargs): return lambda f: f
+    def File(*args, **kwargs): return None
+    def Form(*args, **kwargs): return None
+    class UploadFile: pass
     def validator(*args, **kwargs): return lambda f: f
     
     uvicorn = None
     HAS_FASTAPI = False
 
+# Cython-based event loop and HTTP parser (uvicorn[standard]); uvloop has no
+# Windows build, so both fall back to uvicorn's defaults when missing
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import httptools  # noqa: F401 - only probed so uvicorn can be told to use it
+    HAS_HTTPTOOLS = True
+except ImportError:
+    HAS_HTTPTOOLS = False
+
+# FastAPI needs python-multipart to parse form uploads; the raw-image
+# inspection endpoint is only registered when it is installed
+try:
+    import python_multipart  # noqa: F401
+    HAS_MULTIPART = True
+except ImportError:
+    try:
+        import multipart  # noqa: F401 - module name before python-multipart 0.0.13
+        HAS_MULTIPART = True
+    except ImportError:
+        HAS_MULTIPART = False
+
+# msgspec validates small WebSocket control messages in C, far cheaper
+# than building a Pydantic model per subscribe
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import numpy as np
+    import cv2
+except ImportError:
+    np = None
+    cv2 = None
+
+# orjson's C encoder handles datetime/UUID natively and is several times
+# faster than stdlib json on the dict-heavy status and event payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a payload to a JSON text frame, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=str)
+
+
+def _model_response(content: Any):
+    """
+    Render handler output straight to a response.
+
+    The models returned by the hot endpoints are built internally from
+    already-typed data, so re-validating them against a ``response_model``
+    is pure overhead; the schema is still published via ``responses=``.
+    """
+    if orjson is not None:
+        return ORJSONResponse(content)
+    return JSONResponse(jsonable_encoder(content))
+
 from ..core.base import (
     BaseAsyncComponent,
     OperationResult,
@@ -61,7 +139,78 @@ from ..core.base import (
     ManufacturingEvent
 )
 from ..computer_vision import QualityInspector, InspectionReport, InspectionResult
-from ..cnc import CNCManager, MachineStatus, MachineState, CNCCommand
+from ..cnc import CNCManager, MachineStatus, MachineState, CNCCommand, run_event_loop
+
+
+# Command lookups used on every command request, built once at import
+_VALID_COMMANDS: FrozenSet[str] = frozenset(cmd.value for cmd in CNCCommand)
+_CRITICAL_COMMANDS: FrozenSet[str] = frozenset({
+    CNCCommand.EMERGENCY_STOP.value,
+    CNCCommand.START_PROGRAM.value,
+})
+
+
+# Image decoding is CPU-bound and releases the GIL inside OpenCV, so it runs
+# on a shared pool instead of blocking the event loop; the per-server
+# semaphore caps how many decoded frames can be pending at once
+DECODE_WORKERS = os.cpu_count() or 1
+DECODE_POOL = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="api-decode")
+
+
+# cv2.imdecode flags that let libjpeg scale inside the IDCT, so a reduced
+# image comes out of decompression without a full-resolution intermediate.
+# Resolved once here rather than with a getattr per decode.
+_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+} if cv2 is not None else dict.fromkeys((1, 2, 4, 8))
+
+
+def _decode_image_bytes(image_bytes: bytes, scale: int = 1):
+    """Decode encoded image bytes into a BGR array (None if invalid)."""
+    # np.frombuffer wraps the bytes without copying; imdecode reads them
+    # directly, so the only copy is the decoded pixel buffer itself
+    return cv2.imdecode(np.frombuffer(image_bytes, np.uint8), _DECODE_FLAGS[scale])
+
+
+# Per decode-thread scratch buffer for multipart uploads: the file is read
+# straight into it and imdecode reads it through a memoryview, so no bytes
+# object is allocated per request. Uploads above the cap use a one-off
+# buffer so a single huge image does not stay pinned in every thread.
+_SCRATCH_MAX_BYTES = 32 * 1024 * 1024
+_scratch = threading.local()
+
+
+def _decode_upload(fileobj, scale: int = 1):
+    """Decode an uploaded image file into a BGR array (None if invalid)."""
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(0)
+    
+    if size > _SCRATCH_MAX_BYTES:
+        buffer = bytearray(size)
+    else:
+        buffer = getattr(_scratch, "buffer", None)
+        if buffer is None or len(buffer) < size:
+            buffer = _scratch.buffer = bytearray(max(size, 1 << 20))
+    
+    view = memoryview(buffer)[:size]
+    if hasattr(fileobj, "readinto"):
+        read = fileobj.readinto(view)
+    else:
+        # SpooledTemporaryFile only gained readinto() in Python 3.11
+        data = fileobj.read()
+        read = len(data)
+        view[:read] = data
+    # imdecode copies the pixels out, so the buffer is free again on return
+    return _decode_image_bytes(view[:read], scale)
+
+
+def _decode_image(image_data: str, scale: int = 1):
+    """Decode a base64 encoded image into a BGR array (None if invalid)."""
+    return _decode_image_bytes(binascii.a2b_base64(image_data), scale)
 
 
 # API Configuration
@@ -77,6 +226,15 @@ class APIConfig:
     secret_key: str = "dev-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    inspect_decode_scale: int = 1  # 1, 2, 4 or 8; downscale applied while decoding
+    inspect_max_batch: int = 1  # >1 micro-batches inspections; only for batched (model) detectors
+    inspect_max_wait_ms: float = 10.0
+    max_concurrent_inspections: int = 4
+    max_queued_inspections: int = 32  # beyond this, inspections get 503 + Retry-After
+    enable_docs: Optional[bool] = None  # None: on unless CV_CNC_ENV=production
+    redis_url: Optional[str] = None  # set to share WebSocket events across workers
+    event_stream: str = "manufacturing:events"
+    event_stream_maxlen: int = 10_000
 
 
 # API Models
@@ -144,9 +302,8 @@ class CommandRequest(BaseModel):
     
     @validator('command')
     def validate_command(cls, v):
-        valid_commands = [cmd.value for cmd in CNCCommand]
-        if v not in valid_commands:
-            raise ValueError(f"Invalid command. Must be one of: {valid_commands}")
+        if v not in _VALID_COMMANDS:
+            raise ValueError(f"Invalid command. Must be one of: {sorted(_VALID_COMMANDS)}")
         return v
 
 
@@ -155,6 +312,38 @@ class EventSubscription(BaseModel):
     event_types: List[str] = Field(..., description="List of event types to subscribe to")
     priority_filter: Optional[str] = Field(default=None, description="Minimum priority level")
     component_filter: Optional[str] = Field(default=None, description="Filter by component")
+    
+    @validator('priority_filter')
+    def validate_priority_filter(cls, v):
+        if not v:
+            return None
+        if v.upper() not in Priority.__members__:
+            raise ValueError(f"Invalid priority. Must be one of: {list(Priority.__members__)}")
+        return v.upper()
+
+
+if msgspec is not None:
+    class _EventSubscriptionStruct(msgspec.Struct):
+        """msgspec mirror of EventSubscription for the WebSocket hot path."""
+        event_types: List[str]
+        priority_filter: Optional[str] = None
+        component_filter: Optional[str] = None
+
+
+def _parse_subscription(data: Dict[str, Any]):
+    """Validate a WebSocket subscribe payload into an EventSubscription-like object."""
+    if msgspec is None:
+        return EventSubscription(**data)
+    
+    subscription = msgspec.convert(data, _EventSubscriptionStruct)
+    if subscription.priority_filter:
+        priority = subscription.priority_filter.upper()
+        if priority not in Priority.__members__:
+            raise ValueError(f"Invalid priority. Must be one of: {list(Priority.__members__)}")
+        subscription.priority_filter = priority
+    else:
+        subscription.priority_filter = None
+    return subscription
 
 
 # Security
@@ -172,8 +361,15 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     return {"user_id": "user123", "permissions": ["read", "write", "admin"]}
 
 
+@functools.lru_cache(maxsize=None)
 def require_permission(permission: str):
-    """Decorator to require specific permissions."""
+    """
+    Decorator to require specific permissions.
+    
+    Memoized so every route asking for the same permission shares one
+    dependency callable, which FastAPI's per-request dependency cache can
+    then resolve once.
+    """
     def decorator(user: dict = Depends(get_current_user)):
         if permission not in user.get("permissions", []):
             raise HTTPException(status_code=403, detail=f"Permission '{permission}' required")
@@ -191,26 +387,77 @@ class ManufacturingAPI(BaseAsyncComponent):
         if FastAPI is None:
             raise ImportError("FastAPI not available. Install fastapi and uvicorn packages.")
         
+        # Interactive docs and the OpenAPI schema are off in production: the
+        # schema walks every route's model graph and stays resident per worker
+        self.enable_docs = config.get('enable_docs') if config else None
+        if self.enable_docs is None:
+            self.enable_docs = os.getenv("CV_CNC_ENV", "development") != "production"
+        
         self.app = FastAPI(
             title="Computer Vision CNC Manufacturing Platform",
             description="Enterprise manufacturing platform with AI-powered quality control",
             version="1.0.0",
-            docs_url="/docs",
-            redoc_url="/redoc"
+            docs_url="/docs" if self.enable_docs else None,
+            redoc_url="/redoc" if self.enable_docs else None,
+            openapi_url="/openapi.json" if self.enable_docs else None,
+            default_response_class=ORJSONResponse if orjson is not None else JSONResponse
         )
         
         # Configuration
         self.host = config.get('host', '0.0.0.0') if config else '0.0.0.0'
         self.port = config.get('port', 8000) if config else 8000
         self.workers = config.get('workers', 1) if config else 1
+        self.inspect_decode_scale = config.get('inspect_decode_scale', 1) if config else 1
+        if self.inspect_decode_scale not in _DECODE_FLAGS:
+            raise ValueError(
+                f"inspect_decode_scale must be one of {sorted(_DECODE_FLAGS)}, "
+                f"got {self.inspect_decode_scale}"
+            )
         
         # Components
         self.quality_inspector: Optional[QualityInspector] = None
         self.cnc_manager: Optional[CNCManager] = None
         
         # WebSocket connections for real-time updates
-        self.websocket_connections: List[WebSocket] = []
-        self.event_subscribers: Dict[str, EventSubscription] = {}
+        # Both keyed by id(websocket): an int hash instead of formatting the
+        # connection's repr on every lookup, and O(1) removal on disconnect
+        self.websocket_connections: Dict[int, WebSocket] = {}
+        self.event_subscribers: Dict[int, EventSubscription] = {}
+        
+        # Subscriber indexes so a broadcast only visits matching connections.
+        # Connections without a subscription receive every event; an empty
+        # event_types list or missing component_filter matches everything.
+        self._unfiltered: Set[int] = set()
+        self._by_event_type: Dict[str, Set[int]] = {}
+        self._any_event_type: Set[int] = set()
+        self._by_component: Dict[str, Set[int]] = {}
+        self._any_component: Set[int] = set()
+        # Minimum priority per connection, resolved to Priority.value once at
+        # subscribe time so the broadcast filter is a plain int compare
+        self._priority_floor: Dict[int, int] = {}
+        
+        # Bounds in-flight image decodes; created on first use so it binds
+        # to the running event loop
+        self._decode_slots: Optional[asyncio.Semaphore] = None
+        
+        # Inspection admission control: bounds how many image buffers are
+        # held at once; the semaphore is created on first use like above
+        self.max_concurrent_inspections = config.get('max_concurrent_inspections', 4) if config else 4
+        self.max_queued_inspections = config.get('max_queued_inspections', 32) if config else 32
+        self._inspect_slots: Optional[asyncio.Semaphore] = None
+        self._inspect_waiting = 0
+        
+        # Cross-worker event fan-out through a Redis stream (disabled when no
+        # redis_url is configured; events then go to local connections only)
+        self.redis_url = config.get('redis_url') if config else None
+        self.event_stream = config.get('event_stream', 'manufacturing:events') if config else 'manufacturing:events'
+        self.event_stream_maxlen = config.get('event_stream_maxlen', 10_000) if config else 10_000
+        self._redis = None
+        
+        # Inspection micro-batching (disabled when max batch is 1)
+        self.inspect_max_batch = config.get('inspect_max_batch', 1) if config else 1
+        self.inspect_max_wait_ms = config.get('inspect_max_wait_ms', 10.0) if config else 10.0
+        self._inspect_queue: Optional[asyncio.Queue] = None
         
         # Server instance
         self.server = None
@@ -276,13 +523,13 @@ class ManufacturingAPI(BaseAsyncComponent):
                 message="Computer Vision CNC Manufacturing Platform API",
                 data={
                     "version": "1.0.0",
-                    "docs": "/docs",
+                    "docs": "/docs" if self.enable_docs else None,
                     "health": "/health"
                 }
             )
         
         # Quality Control Endpoints
-        @self.app.post("/api/v1/quality/inspect", response_model=InspectionResponse)
+        @self.app.post("/api/v1/quality/inspect", responses={200: {"model": InspectionResponse}})
         async def quality_inspect(
             request: InspectionRequest,
             background_tasks: BackgroundTasks,
@@ -292,51 +539,50 @@ class ManufacturingAPI(BaseAsyncComponent):
             if not self.quality_inspector:
                 raise HTTPException(status_code=503, detail="Quality inspector not available")
             
-            try:
-                # Decode base64 image
-                import base64
-                import numpy as np
-                import cv2
-                
-                image_bytes = base64.b64decode(request.image_data)
-                nparr = np.frombuffer(image_bytes, np.uint8)
-                image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                
-                if image is None:
-                    raise HTTPException(status_code=400, detail="Invalid image data")
-                
-                # Perform inspection
-                result = await self.quality_inspector.inspect_part(image, request.part_id)
-                
-                if not result.success:
-                    raise HTTPException(status_code=500, detail=f"Inspection failed: {result.error}")
-                
-                report = result.result
-                
-                # Log inspection event
-                background_tasks.add_task(
-                    self._log_inspection_event,
-                    report,
-                    user["user_id"]
-                )
+            async with self._admit_inspection() as release_slot:
+                try:
+                    # Decode base64 image off the event loop
+                    image = await self._decode_off_loop(_decode_image, request.image_data)
+                    return await self._inspection_response(image, request.part_id, background_tasks, user, release_slot)
+                    
+                except HTTPException:
+                    # 400 for undecodable images, 500 for failed inspections
+                    raise
+                except Exception as e:
+                    self.logger.error(f"Quality inspection error: {str(e)}")
+                    raise HTTPException(status_code=500, detail="Internal server error")
+        
+        if HAS_MULTIPART:
+            @self.app.post("/api/v1/quality/inspect_raw", responses={200: {"model": InspectionResponse}})
+            async def quality_inspect_raw(
+                background_tasks: BackgroundTasks,
+                image: UploadFile = File(..., description="Encoded image file (JPEG, PNG, ...)"),
+                part_id: str = Form(..., description="Unique part identifier"),
+                user: dict = Depends(require_permission("quality_inspect"))
+            ):
+                """Perform quality inspection on a part uploaded as a multipart file."""
+                if not self.quality_inspector:
+                    raise HTTPException(status_code=503, detail="Quality inspector not available")
                 
-                return InspectionResponse(
-                    part_id=report.part_id,
-                    inspection_result=report.inspection_result.name,
-                    overall_score=report.overall_score,
-                    defect_count=report.defect_count,
-                    processing_time_ms=report.processing_time_ms,
-                    defects=[self._defect_to_dict(d) for d in report.defects],
-                    measurements=[self._measurement_to_dict(m) for m in report.measurements],
-                    timestamp=report.inspection_timestamp
-                )
+                part_id = part_id.strip()
+                if not part_id:
+                    raise HTTPException(status_code=422, detail="Part ID cannot be empty")
                 
-            except Exception as e:
-                self.logger.error(f"Quality inspection error: {str(e)}")
-                raise HTTPException(status_code=500, detail="Internal server error")
+                async with self._admit_inspection() as release_slot:
+                    try:
+                        # Binary upload: no base64 inflation and no JSON parse of
+                        # the image bytes before they reach the decoder
+                        decoded = await self._decode_off_loop(_decode_upload, image.file)
+                        return await self._inspection_response(decoded, part_id, background_tasks, user, release_slot)
+                        
+                    except HTTPException:
+                        raise
+                    except Exception as e:
+                        self.logger.error(f"Quality inspection error: {str(e)}")
+                        raise HTTPException(status_code=500, detail="Internal server error")
         
         # Machine Management Endpoints
-        @self.app.get("/api/v1/machines", response_model=Dict[str, MachineStatusResponse])
+        @self.app.get("/api/v1/machines", responses={200: {"model": Dict[str, MachineStatusResponse]}})
         async def get_all_machines(user: dict = Depends(require_permission("machine_read"))):
             """Get status of all machines."""
             if not self.cnc_manager:
@@ -346,13 +592,12 @@ class ManufacturingAPI(BaseAsyncComponent):
             if not result.success:
                 raise HTTPException(status_code=500, detail=f"Failed to get machine status: {result.error}")
             
-            response = {}
-            for machine_id, status in result.result.items():
-                response[machine_id] = self._status_to_response(status)
-            
-            return response
+            return _model_response({
+                machine_id: self._status_to_response(status).dict()
+                for machine_id, status in result.result.items()
+            })
         
-        @self.app.get("/api/v1/machines/{machine_id}", response_model=MachineStatusResponse)
+        @self.app.get("/api/v1/machines/{machine_id}", responses={200: {"model": MachineStatusResponse}})
         async def get_machine_status(
             machine_id: str,
             user: dict = Depends(require_permission("machine_read"))
@@ -368,7 +613,7 @@ class ManufacturingAPI(BaseAsyncComponent):
             if not controller.current_status:
                 raise HTTPException(status_code=503, detail="Machine status not available")
             
-            return self._status_to_response(controller.current_status)
+            return _model_response(self._status_to_response(controller.current_status).dict())
         
         @self.app.post("/api/v1/machines/{machine_id}/command")
         async def send_machine_command(
@@ -384,8 +629,7 @@ class ManufacturingAPI(BaseAsyncComponent):
                 raise HTTPException(status_code=404, detail="Machine not found")
             
             # Safety check for critical commands
-            critical_commands = [CNCCommand.EMERGENCY_STOP.value, CNCCommand.START_PROGRAM.value]
-            if request.command in critical_commands and not request.safety_confirmation:
+            if request.command in _CRITICAL_COMMANDS and not request.safety_confirmation:
                 raise HTTPException(
                     status_code=400,
                     detail="Safety confirmation required for critical commands"
@@ -424,26 +668,223 @@ class ManufacturingAPI(BaseAsyncComponent):
         async def websocket_events(websocket: WebSocket):
             """WebSocket endpoint for real-time events."""
             await websocket.accept()
-            self.websocket_connections.append(websocket)
+            connection_id = id(websocket)
+            self.websocket_connections[connection_id] = websocket
+            self._unfiltered.add(connection_id)
             
             try:
                 while True:
                     # Keep connection alive and handle incoming messages
                     data = await websocket.receive_text()
-                    message = json.loads(data)
+                    message = orjson.loads(data) if orjson is not None else json.loads(data)
                     
                     if message.get("type") == "subscribe":
                         # Handle event subscription
-                        subscription = EventSubscription(**message.get("data", {}))
-                        self.event_subscribers[str(websocket)] = subscription
+                        subscription = _parse_subscription(message.get("data", {}))
+                        self._subscribe(connection_id, subscription)
                     
             except Exception as e:
                 self.logger.error(f"WebSocket error: {str(e)}")
             finally:
-                if websocket in self.websocket_connections:
-                    self.websocket_connections.remove(websocket)
-                if str(websocket) in self.event_subscribers:
-                    del self.event_subscribers[str(websocket)]
+                self._drop_connection(connection_id)
+    
+    def _subscribe(self, connection_id: int, subscription: EventSubscription):
+        """Register (or replace) a connection's subscription and index it."""
+        self._unindex(connection_id)
+        self.event_subscribers[connection_id] = subscription
+        
+        if subscription.event_types:
+            for event_type in subscription.event_types:
+                self._by_event_type.setdefault(event_type, set()).add(connection_id)
+        else:
+            self._any_event_type.add(connection_id)
+        
+        if subscription.component_filter:
+            self._by_component.setdefault(subscription.component_filter, set()).add(connection_id)
+        else:
+            self._any_component.add(connection_id)
+        
+        if subscription.priority_filter:
+            self._priority_floor[connection_id] = Priority[subscription.priority_filter].value
+    
+    def _unindex(self, connection_id: int):
+        """Remove a connection from the subscriber indexes."""
+        self._unfiltered.discard(connection_id)
+        self._priority_floor.pop(connection_id, None)
+        subscription = self.event_subscribers.pop(connection_id, None)
+        if subscription is None:
+            return
+        
+        for event_type in subscription.event_types or ():
+            ids = self._by_event_type.get(event_type)
+            if ids is not None:
+                ids.discard(connection_id)
+                if not ids:
+                    del self._by_event_type[event_type]
+        self._any_event_type.discard(connection_id)
+        
+        if subscription.component_filter:
+            ids = self._by_component.get(subscription.component_filter)
+            if ids is not None:
+                ids.discard(connection_id)
+                if not ids:
+                    del self._by_component[subscription.component_filter]
+        self._any_component.discard(connection_id)
+    
+    def _drop_connection(self, connection_id: int):
+        """Forget a WebSocket connection and its subscription."""
+        self.websocket_connections.pop(connection_id, None)
+        self._unindex(connection_id)
+    
+    def _candidate_connections(self, event_type: str, source_component: str) -> Set[int]:
+        """Connections whose event type and component filters match the event."""
+        by_type = self._by_event_type.get(event_type)
+        by_component = self._by_component.get(source_component)
+        type_matches = self._any_event_type | by_type if by_type else self._any_event_type
+        component_matches = (
+            self._any_component | by_component if by_component else self._any_component
+        )
+        return (type_matches & component_matches) | self._unfiltered
+    
+    @asynccontextmanager
+    async def _admit_inspection(self):
+        """
+        Hold an inspection slot, rejecting with 503 when the wait queue is full.
+        
+        Yields a callable that hands the slot back early; it is idempotent,
+        and the slot is released on exit if it has not been already.
+        """
+        if self._inspect_slots is None:
+            self._inspect_slots = asyncio.Semaphore(self.max_concurrent_inspections)
+        
+        if self._inspect_slots.locked() and self._inspect_waiting >= self.max_queued_inspections:
+            raise HTTPException(
+                status_code=503,
+                detail="Inspection capacity exceeded, retry shortly",
+                headers={"Retry-After": "1"}
+            )
+        
+        self._inspect_waiting += 1
+        try:
+            await self._inspect_slots.acquire()
+        finally:
+            self._inspect_waiting -= 1
+        
+        released = False
+        
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                self._inspect_slots.release()
+        
+        try:
+            yield release
+        finally:
+            release()
+    
+    async def _decode_off_loop(self, decoder, data):
+        """Run an image decoder on DECODE_POOL, bounded by the decode semaphore."""
+        if self._decode_slots is None:
+            self._decode_slots = asyncio.Semaphore(2 * DECODE_WORKERS)
+        
+        async with self._decode_slots:
+            return await asyncio.get_running_loop().run_in_executor(
+                DECODE_POOL, decoder, data, self.inspect_decode_scale
+            )
+    
+    async def _inspection_response(self, image, part_id: str, background_tasks, user: dict, release_slot):
+        """Inspect a decoded image and render the InspectionResponse."""
+        if image is None:
+            raise HTTPException(status_code=400, detail="Invalid image data")
+        
+        # Perform inspection
+        result = await self._inspect(image, part_id, release_slot)
+        
+        if not result.success:
+            raise HTTPException(status_code=500, detail=f"Inspection failed: {result.error}")
+        
+        report = result.result
+        
+        # Log inspection event
+        background_tasks.add_task(
+            self._log_inspection_event,
+            report,
+            user["user_id"]
+        )
+        
+        return _model_response(InspectionResponse(
+            part_id=report.part_id,
+            inspection_result=report.inspection_result.name,
+            overall_score=report.overall_score,
+            defect_count=report.defect_count,
+            processing_time_ms=report.processing_time_ms,
+            defects=[self._defect_to_dict(d) for d in report.defects],
+            measurements=[self._measurement_to_dict(m) for m in report.measurements],
+            timestamp=report.inspection_timestamp
+        ).dict())
+    
+    async def _inspect(self, image, part_id: str, release_slot) -> OperationResult[InspectionReport]:
+        """
+        Run an inspection, through the micro-batcher when it is enabled.
+        
+        Batching only pays off with a detector whose inspect_batch runs one
+        forward pass per batch; otherwise it only adds up to
+        inspect_max_wait_ms of latency. Once queued, an image gives back its
+        admission slot: the bounded queue then limits buffered images, and a
+        batch can grow past max_concurrent_inspections.
+        """
+        if self.inspect_max_batch <= 1:
+            return await self.quality_inspector.inspect_part(image, part_id)
+        
+        if self._inspect_queue is None:
+            # Bounded so a burst of requests applies backpressure upstream
+            self._inspect_queue = asyncio.Queue(maxsize=4 * self.inspect_max_batch)
+            await self.add_task(self._inspection_batcher())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._inspect_queue.put((image, part_id, future))
+        release_slot()
+        return await future
+    
+    async def _inspection_batcher(self):
+        """Drain queued inspections in batches of up to inspect_max_batch."""
+        loop = asyncio.get_running_loop()
+        max_wait = self.inspect_max_wait_ms / 1000.0
+        
+        while True:
+            batch = [await self._inspect_queue.get()]
+            deadline = loop.time() + max_wait
+            
+            while len(batch) < self.inspect_max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._inspect_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                results = await self.quality_inspector.inspect_batch(
+                    [image for image, _, _ in batch],
+                    [part_id for _, part_id, _ in batch]
+                )
+                # zip() would silently drop the unmatched requests, leaving
+                # their futures (and HTTP requests) pending forever
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"Detector returned {len(results)} results for {len(batch)} images"
+                    )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
     
     async def _log_inspection_event(self, report: InspectionReport, user_id: str):
         """Log inspection event for audit trail."""
@@ -465,67 +906,127 @@ class ManufacturingAPI(BaseAsyncComponent):
     
     async def _broadcast_event(self, event: ManufacturingEvent):
         """Broadcast event to WebSocket subscribers."""
-        if not self.websocket_connections:
+        if self._redis is None:
+            await self._broadcast_local(event)
             return
         
-        event_data = {
-            "type": "event",
-            "data": event.to_dict()
-        }
-        
-        disconnected_connections = []
+        # Always publish: subscribers may be connected to other workers.
+        # Every worker (including this one) relays it from the stream; the
+        # routing fields travel alongside so readers can filter
+        try:
+            await self._redis.xadd(
+                self.event_stream,
+                {
+                    "event_type": event.event_type,
+                    "source_component": event.source_component,
+                    "priority": event.priority.value,
+                    "data": self._event_payload(event)
+                },
+                maxlen=self.event_stream_maxlen,
+                approximate=True
+            )
+        except Exception as e:
+            # Redis unreachable: other workers miss the event, but this
+            # worker's subscribers still get it
+            self.logger.warning(f"Event stream publish failed, delivering locally: {str(e)}")
+            await self._broadcast_local(event)
+    
+    async def _broadcast_local(self, event: ManufacturingEvent):
+        """Send an event to the matching connections on this worker."""
+        # Match first: when nobody on this worker wants the event, skip
+        # to_dict() and serialization entirely
+        recipients = self._recipients(event.event_type, event.source_component, event.priority.value)
+        if recipients:
+            await self._send_to(recipients, self._event_payload(event))
+    
+    async def _stream_last_id(self) -> str:
+        """ID of the newest entry in the event stream ("0-0" while it is empty)."""
+        newest = await self._redis.xrevrange(self.event_stream, count=1)
+        return newest[0][0] if newest else "0-0"
+    
+    async def _relay_stream_events(self, last_id: Optional[str] = None):
+        """
+        Forward events from the shared Redis stream to local WebSockets.
         
-        for websocket in self.websocket_connections:
+        Reads continue from an explicit entry ID rather than "$", which
+        would skip anything published before the first XREAD (including
+        this worker's own events) and again after every read error.
+        """
+        while True:
             try:
-                # Check if this subscriber wants this event
-                subscription = self.event_subscribers.get(str(websocket))
-                if subscription and not self._should_send_event(event, subscription):
-                    continue
-                
-                await websocket.send_text(json.dumps(event_data))
+                if last_id is None:
+                    last_id = await self._stream_last_id()
+                entries = await self._redis.xread({self.event_stream: last_id}, block=1000, count=100)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                self.logger.warning(f"Failed to send event to WebSocket: {str(e)}")
-                disconnected_connections.append(websocket)
+                self.logger.warning(f"Event stream read failed: {str(e)}")
+                await asyncio.sleep(1.0)
+                continue
+            
+            for _, messages in entries:
+                for message_id, fields in messages:
+                    last_id = message_id
+                    recipients = self._recipients(
+                        fields["event_type"],
+                        fields["source_component"],
+                        int(fields["priority"])
+                    )
+                    if recipients:
+                        await self._send_to(recipients, fields["data"])
+    
+    @staticmethod
+    def _event_payload(event: ManufacturingEvent) -> str:
+        """Serialize an event once; every subscriber receives the same frame."""
+        return _dumps({
+            "type": "event",
+            "data": event.to_dict()
+        })
+    
+    def _recipients(self, event_type: str, source_component: str, priority: int) -> List[tuple]:
+        """Connections on this worker that should receive the event."""
+        # Filtered synchronously so the snapshot is consistent before any
+        # send is awaited. Event type and component are matched by the
+        # indexes; only the priority threshold is checked per connection.
+        recipients = []
+        for connection_id in self._candidate_connections(event_type, source_component):
+            websocket = self.websocket_connections.get(connection_id)
+            if websocket is None:
+                continue
+            floor = self._priority_floor.get(connection_id)
+            if floor is not None and priority > floor:
+                continue
+            recipients.append((connection_id, websocket))
+        return recipients
+    
+    async def _send_to(self, recipients: List[tuple], payload: str):
+        """Send one frame to all recipients concurrently."""
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for _, websocket in recipients),
+            return_exceptions=True
+        )
         
         # Clean up disconnected connections
-        for websocket in disconnected_connections:
-            if websocket in self.websocket_connections:
-                self.websocket_connections.remove(websocket)
-            if str(websocket) in self.event_subscribers:
-                del self.event_subscribers[str(websocket)]
-    
-    def _should_send_event(self, event: ManufacturingEvent, subscription: EventSubscription) -> bool:
-        """Check if event should be sent to subscriber."""
-        # Filter by event type
-        if subscription.event_types and event.event_type not in subscription.event_types:
-            return False
-        
-        # Filter by priority
-        if subscription.priority_filter:
-            min_priority = Priority[subscription.priority_filter.upper()]
-            if event.priority.value > min_priority.value:
-                return False
-        
-        # Filter by component
-        if subscription.component_filter and event.source_component != subscription.component_filter:
-            return False
-        
-        return True
+        for (connection_id, _), result in zip(recipients, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to send event to WebSocket: {str(result)}")
+                self._drop_connection(connection_id)
     
     def _defect_to_dict(self, defect) -> Dict[str, Any]:
         """Convert defect detection to dictionary."""
+        box = defect.bounding_box
         return {
             "type": defect.defect_type.value,
             "confidence": defect.confidence,
             "severity": defect.severity,
             "bounding_box": {
-                "x": defect.bounding_box.x,
-                "y": defect.bounding_box.y,
-                "width": defect.bounding_box.width,
-                "height": defect.bounding_box.height
+                "x": box.x,
+                "y": box.y,
+                "width": box.width,
+                "height": box.height
             },
             "description": defect.description,
-            "timestamp": defect.detection_timestamp.isoformat()
+            "timestamp": defect.detection_timestamp
         }
     
     def _measurement_to_dict(self, measurement) -> Dict[str, Any]:
@@ -538,7 +1039,7 @@ class ManufacturingAPI(BaseAsyncComponent):
             "tolerance_min": measurement.tolerance_min,
             "tolerance_max": measurement.tolerance_max,
             "confidence": measurement.confidence,
-            "timestamp": measurement.measurement_timestamp.isoformat()
+            "timestamp": measurement.measurement_timestamp
         }
     
     def _status_to_response(self, status: MachineStatus) -> MachineStatusResponse:
@@ -549,8 +1050,8 @@ class ManufacturingAPI(BaseAsyncComponent):
             is_operational=status.is_operational,
             program_name=status.program_name,
             feedrate=status.feedrate,
-            axis_positions={name: {"position": pos.position, "unit": pos.unit} 
-                          for name, pos in status.axis_positions.items()},
+            axis_positions={name: {"position": position, "unit": status.axis_positions.unit}
+                          for name, position in status.axis_positions.positions().items()},
             alarms=status.alarms,
             timestamp=status.timestamp
         )
@@ -584,11 +1085,15 @@ class ManufacturingAPI(BaseAsyncComponent):
                 host=self.host,
                 port=self.port,
                 workers=self.workers,
+                loop="uvloop" if uvloop is not None else "auto",
+                http="httptools" if HAS_HTTPTOOLS else "auto",
                 log_level="info"
             )
             
             self.server = uvicorn.Server(config)
             
+            await self._start_event_relay()
+            
             # Start server in background
             await self.add_task(self.server.serve())
             
@@ -601,6 +1106,36 @@ class ManufacturingAPI(BaseAsyncComponent):
                 error_code="SERVER_START_ERROR"
             )
     
+    async def _start_event_relay(self):
+        """Connect to the shared event stream when a redis_url is configured."""
+        if self.redis_url:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+            
+            # Seed the read position before anything can be published; if
+            # Redis is down now, publishes fall back to local delivery and
+            # the relay seeds itself once the server is reachable
+            try:
+                last_id = await self._stream_last_id()
+            except Exception as e:
+                self.logger.warning(f"Event stream unavailable at startup: {str(e)}")
+                last_id = None
+            await self.add_task(self._relay_stream_events(last_id))
+    
+    @asynccontextmanager
+    async def _worker_lifespan(self, app):
+        """Run the component lifecycle inside a Gunicorn worker's event loop."""
+        init_result = await self.initialize()
+        if not init_result.success:
+            raise RuntimeError(f"Failed to initialize API: {init_result.error}")
+        
+        await self._start_event_relay()
+        self.set_state(ComponentState.RUNNING, "API worker started")
+        try:
+            yield
+        finally:
+            await self.shutdown()
+    
     async def shutdown(self) -> OperationResult[bool]:
         """Shutdown API server."""
         try:
@@ -608,7 +1143,7 @@ class ManufacturingAPI(BaseAsyncComponent):
                 self.server.should_exit = True
             
             # Close WebSocket connections
-            for websocket in self.websocket_connections.copy():
+            for websocket in list(self.websocket_connections.values()):
                 try:
                     await websocket.close()
                 except Exception:
@@ -621,7 +1156,13 @@ class ManufacturingAPI(BaseAsyncComponent):
             if self.cnc_manager:
                 await self.cnc_manager.shutdown()
             
-            return await super().shutdown()
+            result = await super().shutdown()
+            
+            if self._redis is not None:
+                await self._redis.aclose()
+                self._redis = None
+            
+            return result
             
         except Exception as e:
             return OperationResult.error_result(
@@ -662,13 +1203,45 @@ def run_api_server(
     if config:
         server_config.update(config)
     
+    # uvicorn.Server runs a single event loop in this process whatever the
+    # workers setting; for real multi-core serving hand the app to Gunicorn
+    # with uvicorn workers (POSIX only, and only when gunicorn is installed)
+    if server_config["workers"] > 1 and sys.platform != "win32":
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError:
+            BaseApplication = None
+        
+        if BaseApplication is not None:
+            _run_gunicorn(BaseApplication, server_config)
+            return
+    
     # Create and run server
     async def main():
         api = await create_api_server(server_config)
         await api.start_server()
         await api.wait_for_shutdown()
     
-    asyncio.run(main())
+    run_event_loop(main())
+
+
+def _run_gunicorn(base_application, server_config: Dict[str, Any]):
+    """Serve the API from Gunicorn with one ManufacturingAPI per worker."""
+    
+    class _GunicornApplication(base_application):
+        def load_config(self):
+            self.cfg.set("bind", f"{server_config['host']}:{server_config['port']}")
+            self.cfg.set("workers", server_config["workers"])
+            self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+        
+        def load(self):
+            # Built in the worker after fork, so asyncio primitives and the
+            # component state belong to that worker's own event loop
+            api = ManufacturingAPI("manufacturing_api", server_config)
+            api.app.router.lifespan_context = api._worker_lifespan
+            return api.app
+    
+    _GunicornApplication().run()
 
 
 # Export public interface
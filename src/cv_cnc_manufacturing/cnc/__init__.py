@@ -10,29 +10,63 @@ implemented before deployment.
 """
 
 import asyncio
+import inspect
+import io
 import json
+import math
+import struct
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, is_dataclass, replace
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Awaitable, Deque, Dict, Iterator, List, Optional, Set, Tuple, Union, Callable
 from urllib.parse import urlparse
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
+# lxml parses MTConnect documents in C and can filter iterparse events by
+# tag; the stdlib parser is the fallback
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+# orjson serializes dataclasses and datetimes natively in C; command
+# payloads (programs with their tool lists) go out as bytes either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libuv-backed event loop with cheaper timers for many monitor loops;
+# no Windows build, so stdlib asyncio is the fallback
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# xxh3 fingerprints each poll's packed status for change detection;
+# builtin hash() is the fallback
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 try:
     from opcua import Client as OPCUAClient, ua
 except ImportError:
     OPCUAClient = None
     ua = None
 
+# pymodbus 3.x asyncio client; register values are decoded with struct
 try:
-    from pymodbus.client.sync import ModbusTcpClient
-    from pymodbus.constants import Endian
-    from pymodbus.payload import BinaryPayloadDecoder
+    from pymodbus.client import AsyncModbusTcpClient
 except ImportError:
-    ModbusTcpClient = None
-    BinaryPayloadDecoder = None
+    AsyncModbusTcpClient = None
 
 from ..core.base import (
     BaseAsyncComponent,
@@ -41,7 +75,8 @@ from ..core.base import (
     ManufacturingException,
     CommunicationException,
     safety_context,
-    create_operation_timer
+    create_operation_timer,
+    DATACLASS_SLOTS
 )
 
 
@@ -83,16 +118,107 @@ class ProtocolType(Enum):
     SERIAL = "serial"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AxisPosition:
     """Position information for a machine axis."""
     axis_name: str
     position: float
     unit: str = "mm"
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Positions are sampled as part of a MachineStatus, which carries the
+    # poll's single timestamp; set this only for standalone readings
+    timestamp: Optional[datetime] = None
+
+
+class AxisPositions:
+    """Axis positions of one status snapshot, stored as a single float64 array.
+    
+    Positions live in ``values`` in the order of ``names``; NaN marks an axis
+    of the layout that this snapshot did not report. Mapping-style access
+    (``[name]``, ``items()``) returns AxisPosition views for existing callers.
+    """
+    
+    __slots__ = ("names", "values", "unit", "_index")
+    
+    def __init__(self, names: Tuple[str, ...] = (), unit: str = "mm"):
+        self.names = tuple(names)
+        self.values = np.full(len(self.names), np.nan)
+        self.unit = unit
+        self._index = {name: i for i, name in enumerate(self.names)}
+    
+    def set(self, axis_name: str, position: float) -> None:
+        """Store a position, extending the layout for a previously unseen axis."""
+        i = self._index.get(axis_name)
+        if i is None:
+            i = len(self.names)
+            self.names += (axis_name,)
+            self._index = dict(self._index)
+            self._index[axis_name] = i
+            self.values = np.append(self.values, np.nan)
+        self.values[i] = position
+    
+    def axis(self, axis_name: str) -> float:
+        """Return the position of one axis."""
+        position = self.values[self._index[axis_name]]
+        if position != position:
+            raise KeyError(axis_name)
+        return float(position)
+    
+    def positions(self) -> Dict[str, float]:
+        """Return reported axes as a name -> position dict."""
+        return {
+            name: position
+            for name, position in zip(self.names, self.values.tolist())
+            if position == position
+        }
+    
+    def copy(self) -> "AxisPositions":
+        clone = AxisPositions.__new__(AxisPositions)
+        clone.names = self.names
+        clone.values = self.values.copy()
+        clone.unit = self.unit
+        clone._index = self._index
+        return clone
+    
+    def __getitem__(self, axis_name: str) -> AxisPosition:
+        return AxisPosition(axis_name=axis_name, position=self.axis(axis_name), unit=self.unit)
+    
+    def __setitem__(self, axis_name: str, value: Union[AxisPosition, float]) -> None:
+        if isinstance(value, AxisPosition):
+            self.unit = value.unit
+            value = value.position
+        self.set(axis_name, float(value))
+    
+    def __contains__(self, axis_name: object) -> bool:
+        i = self._index.get(axis_name)
+        return i is not None and self.values[i] == self.values[i]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.positions())
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.values)))
+    
+    def keys(self):
+        return self.positions().keys()
+    
+    def items(self):
+        return [(name, self[name]) for name in self.positions()]
+    
+    def get(self, axis_name: str, default: Optional[AxisPosition] = None) -> Optional[AxisPosition]:
+        return self[axis_name] if axis_name in self else default
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AxisPositions):
+            return NotImplemented
+        return self.names == other.names and np.array_equal(self.values, other.values, equal_nan=True)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"AxisPositions({self.positions()!r}, unit={self.unit!r})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolInfo:
     """Information about a cutting tool."""
     tool_id: str
@@ -107,7 +233,7 @@ class ToolInfo:
     last_used: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SpindleStatus:
     """Spindle status information."""
     speed_rpm: float
@@ -117,7 +243,7 @@ class SpindleStatus:
     direction: str = "stopped"  # "stopped", "clockwise", "counterclockwise"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MachineStatus:
     """Comprehensive machine status."""
     machine_id: str
@@ -125,7 +251,7 @@ class MachineStatus:
     program_name: Optional[str] = None
     line_number: Optional[int] = None
     feedrate: Optional[float] = None
-    axis_positions: Dict[str, AxisPosition] = field(default_factory=dict)
+    axis_positions: AxisPositions = field(default_factory=AxisPositions)
     spindle_status: Optional[SpindleStatus] = None
     current_tool: Optional[ToolInfo] = None
     coolant_on: bool = False
@@ -144,9 +270,22 @@ class MachineStatus:
     def has_errors(self) -> bool:
         """Check if machine has any errors or alarms."""
         return len(self.alarms) > 0 or self.emergency_stop_active
+    
+    def snapshot(self) -> "MachineStatus":
+        """Copy that shares no mutable state with this status."""
+        spindle = self.spindle_status
+        tool = self.current_tool
+        return replace(
+            self,
+            axis_positions=self.axis_positions.copy(),
+            spindle_status=replace(spindle) if spindle is not None else None,
+            current_tool=replace(tool) if tool is not None else None,
+            alarms=list(self.alarms),
+            warnings=list(self.warnings)
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProgramInfo:
     """Information about a CNC program."""
     program_name: str
@@ -159,6 +298,113 @@ class ProgramInfo:
     last_modified: Optional[datetime] = None
 
 
+def _json_default(obj: Any) -> Any:
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat().replace("+00:00", "Z")
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a command payload to JSON bytes, naive datetimes as UTC."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+
+
+# Execution values reported by controllers (MTConnect Execution, or the
+# equivalent OPC-UA variable) mapped to machine states
+_EXECUTION_STATES = {
+    "ACTIVE": MachineState.ACTIVE,
+    "READY": MachineState.READY,
+    "STOPPED": MachineState.STOPPED,
+    "INTERRUPTED": MachineState.INTERRUPTED
+}
+
+# MTConnect EmergencyStop values -> emergency_stop_active
+_EMERGENCY_STOP_STATES = {
+    "ARMED": True,
+    "TRIGGERED": False
+}
+
+
+# Agents report these values in the canonical upper case, so the exact
+# lookup almost always hits and .upper() only runs for odd spellings
+def _execution_state(value: str) -> MachineState:
+    state = _EXECUTION_STATES.get(value)
+    if state is None:
+        state = _EXECUTION_STATES.get(value.upper(), MachineState.UNAVAILABLE)
+    return state
+
+
+def _emergency_stop_armed(value: str) -> bool:
+    armed = _EMERGENCY_STOP_STATES.get(value)
+    if armed is None:
+        armed = value.upper() == "ARMED"
+    return armed
+
+
+def _apply_status_field(status: MachineStatus, field_name: str, value: Any) -> None:
+    """
+    Apply one named status value to a MachineStatus.
+    
+    Field names are the keys of an OPC-UA ``node_map``: ``execution``,
+    ``emergency_stop``, ``program``, ``line_number``, ``feedrate``,
+    ``spindle_speed``, ``spindle_load`` and ``position_<axis>``. Nested
+    objects are replaced rather than mutated so earlier snapshots stay intact.
+    """
+    if value is None:
+        return
+    
+    if field_name == "execution":
+        status.state = _execution_state(str(value))
+    elif field_name == "emergency_stop":
+        status.emergency_stop_active = (
+            _emergency_stop_armed(value) if isinstance(value, str) else bool(value)
+        )
+    elif field_name == "program":
+        status.program_name = str(value)
+    elif field_name == "line_number":
+        status.line_number = int(value)
+    elif field_name == "feedrate":
+        status.feedrate = float(value)
+    elif field_name in ("spindle_speed", "spindle_load"):
+        spindle = status.spindle_status or SpindleStatus(speed_rpm=0, load_percent=0)
+        if field_name == "spindle_speed":
+            status.spindle_status = replace(spindle, speed_rpm=float(value))
+        else:
+            status.spindle_status = replace(spindle, load_percent=float(value))
+    elif field_name.startswith("position_"):
+        axis_name = field_name[len("position_"):]
+        status.axis_positions.set(axis_name, float(value))
+
+
+# state, feedrate (NaN when unknown), spindle speed, e-stop
+_SIGNATURE_HEADER = struct.Struct("<idd?")
+
+
+def _status_signature(status: MachineStatus) -> int:
+    """Cheap fingerprint of the fields status callbacks react to."""
+    spindle = status.spindle_status
+    feedrate = status.feedrate
+    packed = _SIGNATURE_HEADER.pack(
+        status.state.value,
+        math.nan if feedrate is None else feedrate,
+        spindle.speed_rpm if spindle else 0.0,
+        status.emergency_stop_active
+    ) + status.axis_positions.values.tobytes()
+    
+    sig = xxhash.xxh3_64_intdigest(packed) if xxhash is not None else hash(packed)
+    if status.alarms:
+        sig ^= hash(tuple(status.alarms))
+    return sig
+
+
 class CNCController(BaseAsyncComponent):
     """Base class for CNC machine controllers."""
     
@@ -176,8 +422,33 @@ class CNCController(BaseAsyncComponent):
         self.connection_config = connection_config
         self.current_status: Optional[MachineStatus] = None
         self.status_update_interval = config.get('status_update_interval', 1.0) if config else 1.0
+        # Poll interval while nothing is changing; force_poll() cuts either short
+        self.idle_interval = config.get('idle_interval', 5.0) if config else 5.0
+        self._wake = asyncio.Event()
+        # Axis layout learned from earlier polls, so new snapshots start with
+        # a full-size position array instead of growing it axis by axis
+        self._axis_names: Tuple[str, ...] = ()
+        # Optionally poll into two alternating status objects instead of
+        # allocating a new one per poll; anything that keeps a status beyond
+        # the next poll must then take a snapshot()
+        self.reuse_status_buffers = config.get('reuse_status_buffers', False) if config else False
+        self._buffers: Optional[List[MachineStatus]] = None
+        self._buf_idx = 0
         self._monitoring_task: Optional[asyncio.Task] = None
-        self._event_callbacks: List[Callable[[MachineStatus], None]] = []
+        # Plain callbacks are scheduled on the loop, coroutine callbacks run
+        # concurrently in a task; neither runs inside the poll loop itself.
+        # Tuples are replaced, never mutated, so dispatch iterates a stable
+        # snapshot even if a callback is added meanwhile.
+        self._sync_callbacks: Tuple[Callable[[MachineStatus], None], ...] = ()
+        self._async_callbacks: Tuple[Callable[[MachineStatus], Awaitable[None]], ...] = ()
+        self._callback_tasks: Set[asyncio.Task] = set()
+        # Thread pool for blocking client calls; None means the loop default
+        self._executor: Optional[Executor] = None
+        # Callbacks fire when the status signature changes, and at least
+        # every callback_heartbeat seconds while it does not
+        self.callback_heartbeat = config.get('callback_heartbeat', 10.0) if config else 10.0
+        self._last_sig: Optional[int] = None
+        self._last_callback_time = 0.0
     
     @abstractmethod
     async def connect(self) -> OperationResult[bool]:
@@ -215,9 +486,92 @@ class CNCController(BaseAsyncComponent):
             await super().emergency_stop()
             return result
     
-    def add_status_callback(self, callback: Callable[[MachineStatus], None]) -> None:
-        """Add a callback for status updates."""
-        self._event_callbacks.append(callback)
+    def add_status_callback(self, callback: Callable[[MachineStatus], Any]) -> None:
+        """Add a callback for status updates (plain function or coroutine function)."""
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks += (callback,)
+        else:
+            self._sync_callbacks += (callback,)
+    
+    def _run_callback(self, callback: Callable[[MachineStatus], None], status: MachineStatus) -> None:
+        try:
+            callback(status)
+        except Exception as e:
+            self.logger.error(f"Error in status callback: {str(e)}")
+    
+    async def _dispatch_async_callbacks(
+        self,
+        callbacks: Tuple[Callable[[MachineStatus], Awaitable[None]], ...],
+        status: MachineStatus
+    ) -> None:
+        results = await asyncio.gather(
+            *(callback(status) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in status callback: {str(result)}")
+    
+    def _notify_callbacks(self, status: MachineStatus) -> None:
+        """Hand a status to callbacks without waiting for them to finish."""
+        loop = asyncio.get_running_loop()
+        for callback in self._sync_callbacks:
+            loop.call_soon(self._run_callback, callback, status)
+        
+        async_callbacks = self._async_callbacks
+        if async_callbacks:
+            task = loop.create_task(self._dispatch_async_callbacks(async_callbacks, status))
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+    
+    def bind_shared(self, session: Any = None, executor: Optional[Executor] = None) -> None:
+        """Use resources owned by a CNCManager instead of private ones."""
+        self._executor = executor
+    
+    def _scratch_status(self) -> MachineStatus:
+        """Return a blank status for the next poll to fill in."""
+        if not self.reuse_status_buffers:
+            return MachineStatus(
+                machine_id=self.machine_id,
+                state=MachineState.READY,
+                axis_positions=AxisPositions(self._axis_names),
+                timestamp=datetime.now(timezone.utc)
+            )
+        
+        if self._buffers is None:
+            self._buffers = [
+                MachineStatus(
+                    machine_id=self.machine_id,
+                    state=MachineState.READY,
+                    axis_positions=AxisPositions(self._axis_names),
+                    spindle_status=SpindleStatus(speed_rpm=0, load_percent=0)
+                )
+                for _ in range(2)
+            ]
+        
+        # Flip to the buffer not currently published and reset it in place
+        self._buf_idx ^= 1
+        status = self._buffers[self._buf_idx]
+        status.state = MachineState.READY
+        status.program_name = None
+        status.line_number = None
+        status.feedrate = None
+        status.axis_positions.values.fill(np.nan)
+        if status.spindle_status is not None:
+            status.spindle_status.speed_rpm = 0
+            status.spindle_status.load_percent = 0
+        status.current_tool = None
+        status.coolant_on = False
+        status.door_open = False
+        status.emergency_stop_active = False
+        status.alarms.clear()
+        status.warnings.clear()
+        status.timestamp = datetime.now(timezone.utc)
+        return status
+    
+    def force_poll(self) -> None:
+        """Wake the monitoring loop for an immediate status poll."""
+        self._wake.set()
     
     async def start_monitoring(self) -> OperationResult[bool]:
         """Start continuous status monitoring."""
@@ -241,15 +595,36 @@ class CNCController(BaseAsyncComponent):
             self._monitoring_task = None
         return OperationResult.success_result(True)
     
+    async def _wait_for_poll(self, interval: float) -> None:
+        """Sleep for interval, returning early if force_poll() is called."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+    
     async def _monitor_status(self) -> None:
-        """Continuous status monitoring loop."""
+        """Continuous status monitoring loop.
+        
+        Polls at status_update_interval while the status signature keeps
+        changing or alarms are active, and backs off to
+        idle_interval otherwise.
+        """
         while not self._shutdown_event.is_set():
             try:
+                poll_fast = False
                 status_result = await self.get_status()
                 if status_result.success:
                     old_status = self.current_status
                     self.current_status = status_result.result
                     
+                    # One change detector drives both polling rate and callbacks
+                    sig = _status_signature(self.current_status)
+                    changed = sig != self._last_sig
+                    # Alarms keep the fast rate; the e-stop flag does not, since
+                    # MTConnect reports ARMED (active) on every healthy machine
+                    poll_fast = changed or bool(self.current_status.alarms)
+                    
                     # Check for state changes or alarms
                     if old_status and old_status.state != self.current_status.state:
                         self.logger.info(
@@ -267,20 +642,129 @@ class CNCController(BaseAsyncComponent):
                             alarms=self.current_status.alarms
                         )
                     
-                    # Notify callbacks
-                    for callback in self._event_callbacks:
-                        try:
-                            callback(self.current_status)
-                        except Exception as e:
-                            self.logger.error(f"Error in status callback: {str(e)}")
+                    # Notify callbacks on change or heartbeat
+                    now = time.monotonic()
+                    if changed or now - self._last_callback_time >= self.callback_heartbeat:
+                        self._last_sig = sig
+                        self._last_callback_time = now
+                        self._notify_callbacks(self.current_status)
                 
-                await asyncio.sleep(self.status_update_interval)
+                await self._wait_for_poll(
+                    self.status_update_interval if poll_fast else self.idle_interval
+                )
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Error in status monitoring: {str(e)}")
-                await asyncio.sleep(self.status_update_interval)
+                await self._wait_for_poll(self.status_update_interval)
+
+
+_MTCONNECT_CONTAINERS = ("Header", "Samples", "Events")
+_MTCONNECT_CONTAINER_TAGS = tuple("{*}" + name for name in _MTCONNECT_CONTAINERS)
+
+
+def _mtconnect_container_names(namespace: str) -> Dict[str, str]:
+    """Map the literal {namespace}Tag of each container to its local name."""
+    return {f"{{{namespace}}}{name}": name for name in _MTCONNECT_CONTAINERS}
+
+
+def _container_name(tag: str, container_names: Optional[Dict[str, str]]) -> Optional[str]:
+    """Local name of a container tag, or None for any other element.
+    
+    container_names, once a document has revealed the agent's namespace,
+    lets the parsers match literal tags instead of {*} wildcards.
+    """
+    if container_names is not None:
+        return container_names.get(tag)
+    local_name = tag.rpartition('}')[2]
+    return local_name if local_name in _MTCONNECT_CONTAINERS else None
+
+
+def _iter_mtconnect_containers(xml_content: bytes, container_names: Optional[Dict[str, str]] = None):
+    """Yield (local name, element) for each Header/Samples/Events element as it closes."""
+    if LET is not None:
+        for _, element in LET.iterparse(
+            io.BytesIO(xml_content),
+            events=("end",),
+            tag=tuple(container_names) if container_names else _MTCONNECT_CONTAINER_TAGS,
+            resolve_entities=False
+        ):
+            yield _container_name(element.tag, container_names), element
+    else:
+        for _, element in ET.iterparse(io.BytesIO(xml_content), events=("end",)):
+            local_name = _container_name(element.tag, container_names)
+            if local_name is not None:
+                yield local_name, element
+
+
+def _mtconnect_pull_parser(container_names: Optional[Dict[str, str]] = None):
+    """Create an incremental parser for one streamed MTConnect document."""
+    if LET is not None:
+        return LET.XMLPullParser(
+            events=("end",),
+            tag=tuple(container_names) if container_names else _MTCONNECT_CONTAINER_TAGS,
+            resolve_entities=False
+        )
+    return ET.XMLPullParser(events=("end",))
+
+
+def _read_mtconnect_containers(parser, container_names: Optional[Dict[str, str]] = None):
+    """Yield (local name, element) for containers completed by the last feed()."""
+    for _, element in parser.read_events():
+        local_name = _container_name(element.tag, container_names)
+        if local_name is not None:
+            yield local_name, element
+
+
+def _release_element(element) -> None:
+    """Free a processed element (and, with lxml, its already-seen siblings)."""
+    element.clear()
+    if LET is not None:
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+# MTConnect data item handlers, dispatched by the element's local name;
+# each takes (element, local name, text, status)
+def _sample_spindle_speed(sample, tag_name: str, value: str, status: MachineStatus) -> None:
+    if not status.spindle_status:
+        status.spindle_status = SpindleStatus(speed_rpm=0, load_percent=0)
+    status.spindle_status.speed_rpm = float(value)
+
+
+def _sample_feedrate(sample, tag_name: str, value: str, status: MachineStatus) -> None:
+    status.feedrate = float(value)
+
+
+def _sample_position(sample, tag_name: str, value: str, status: MachineStatus) -> None:
+    status.axis_positions.set(sample.get('name', tag_name), float(value))
+
+
+def _event_execution(event, tag_name: str, value: str, status: MachineStatus) -> None:
+    status.state = _execution_state(value)
+
+
+def _event_emergency_stop(event, tag_name: str, value: str, status: MachineStatus) -> None:
+    status.emergency_stop_active = _emergency_stop_armed(value)
+
+
+def _event_program(event, tag_name: str, value: str, status: MachineStatus) -> None:
+    status.program_name = value
+
+
+_MTCONNECT_SAMPLE_HANDLERS = {
+    "SpindleSpeed": _sample_spindle_speed,
+    "Feedrate": _sample_feedrate,
+}
+_POSITION_PREFIX = "Position"  # Position, PositionX, ... carry axis samples
+
+_MTCONNECT_EVENT_HANDLERS = {
+    "Execution": _event_execution,
+    "EmergencyStop": _event_emergency_stop,
+    "Program": _event_program,
+}
 
 
 class MTConnectController(CNCController):
@@ -290,23 +774,62 @@ class MTConnectController(CNCController):
         super().__init__(component_id, machine_id, ProtocolType.MTCONNECT, connection_config, config)
         self.base_url = connection_config.get('base_url', 'http://localhost:5000')
         self.device_uuid = connection_config.get('device_uuid')
+        self.request_timeout = connection_config.get('request_timeout', 2.0)
+        self._probe_url = f"{self.base_url}/probe"
+        self._current_url = f"{self.base_url}/current"
+        self._sample_url = f"{self.base_url}/sample"
+        if self.device_uuid:
+            self._current_url += f"?device={self.device_uuid}"
+        
+        # Keep-alive session, so status polls reuse the TCP connection instead
+        # of reconnecting every interval. CNCManager shares one across all
+        # its controllers; a standalone controller opens its own.
+        self._session = None
+        self._owns_session = True
+        self._timeout = None
         
+        # While monitoring, a long-lived /sample stream pushes only the data
+        # items that changed; get_status then reads the streamed status
+        self.use_streaming = connection_config.get('use_streaming', True)
+        self._stream_task: Optional[asyncio.Task] = None
+        self._stream_status: Optional[MachineStatus] = None
+        self._next_sequence: Optional[str] = None
+        # Literal container tags, learned from the first document's namespace
+        self._container_names: Optional[Dict[str, str]] = None
+    
+    def bind_shared(self, session: Any = None, executor: Optional[Executor] = None) -> None:
+        """Use a CNCManager's shared HTTP session and executor."""
+        super().bind_shared(session=session, executor=executor)
+        if session is not None:
+            self._session = session
+            self._owns_session = False
+    
+    async def _get_session(self):
+        """Return the pooled HTTP session, creating it on first use."""
+        if self._timeout is None:
+            import aiohttp
+            self._timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        if self._session is None or self._session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=4, keepalive_timeout=60, enable_cleanup_closed=True)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+    
     async def initialize(self) -> OperationResult[bool]:
         """Initialize MTConnect connection."""
         try:
             # Test connection by requesting probe
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                probe_url = f"{self.base_url}/probe"
-                async with session.get(probe_url) as response:
-                    if response.status == 200:
-                        self.set_state(ComponentState.READY, "MTConnect initialized")
-                        return OperationResult.success_result(True)
-                    else:
-                        return OperationResult.error_result(
-                            f"MTConnect probe failed: HTTP {response.status}",
-                            error_code="CONNECTION_FAILED"
-                        )
+            session = await self._get_session()
+            async with session.get(self._probe_url, timeout=self._timeout) as response:
+                if response.status == 200:
+                    self.set_state(ComponentState.READY, "MTConnect initialized")
+                    return OperationResult.success_result(True)
+                else:
+                    return OperationResult.error_result(
+                        f"MTConnect probe failed: HTTP {response.status}",
+                        error_code="CONNECTION_FAILED"
+                    )
         except Exception as e:
             return OperationResult.error_result(
                 f"MTConnect initialization failed: {str(e)}",
@@ -319,34 +842,62 @@ class MTConnectController(CNCController):
     
     async def disconnect(self) -> OperationResult[bool]:
         """Disconnect from MTConnect agent."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
         return OperationResult.success_result(True)
     
+    async def start_monitoring(self) -> OperationResult[bool]:
+        """Start status monitoring, streaming /sample updates when enabled."""
+        result = await super().start_monitoring()
+        if result.success and self.use_streaming:
+            self._stream_task = await self.add_task(self._stream_samples())
+        return result
+    
+    async def stop_monitoring(self) -> OperationResult[bool]:
+        """Stop status monitoring and close the /sample stream."""
+        if self._stream_task:
+            self._stream_task.cancel()
+            try:
+                await self._stream_task
+            except asyncio.CancelledError:
+                pass
+            self._stream_task = None
+        self._stream_status = None
+        return await super().stop_monitoring()
+    
     async def get_status(self) -> OperationResult[MachineStatus]:
         """Get current machine status via MTConnect."""
+        if self._stream_status is not None:
+            # The stream keeps updating _stream_status in place (spindle
+            # included); hand out a full copy so history and callbacks keep
+            # the values of this poll
+            return OperationResult.success_result(self._stream_status.snapshot())
+        return await self._poll_current()
+    
+    async def _poll_current(self) -> OperationResult[MachineStatus]:
+        """Request a full /current document from the agent."""
         timer = create_operation_timer()
         
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                current_url = f"{self.base_url}/current"
-                if self.device_uuid:
-                    current_url += f"?device={self.device_uuid}"
-                
-                async with session.get(current_url) as response:
-                    if response.status != 200:
-                        return OperationResult.error_result(
-                            f"MTConnect current request failed: HTTP {response.status}",
-                            error_code="REQUEST_FAILED",
-                            duration_ms=timer()
-                        )
-                    
-                    xml_content = await response.text()
-                    status = self._parse_mtconnect_status(xml_content)
-                    
-                    return OperationResult.success_result(
-                        status,
+            session = await self._get_session()
+            async with session.get(self._current_url, timeout=self._timeout) as response:
+                if response.status != 200:
+                    return OperationResult.error_result(
+                        f"MTConnect current request failed: HTTP {response.status}",
+                        error_code="REQUEST_FAILED",
                         duration_ms=timer()
                     )
+                
+                # Raw bytes: the parser reads the XML encoding declaration
+                # itself, so there is no separate decode pass
+                xml_content = await response.read()
+                status = self._parse_mtconnect_status(xml_content)
+                
+                return OperationResult.success_result(
+                    status,
+                    duration_ms=timer()
+                )
         
         except Exception as e:
             return OperationResult.error_result(
@@ -355,28 +906,22 @@ class MTConnectController(CNCController):
                 duration_ms=timer()
             )
     
-    def _parse_mtconnect_status(self, xml_content: str) -> MachineStatus:
+    def _parse_mtconnect_status(self, xml_content: Union[bytes, str]) -> MachineStatus:
         """Parse MTConnect XML response to extract machine status."""
         try:
-            root = ET.fromstring(xml_content)
+            if isinstance(xml_content, str):
+                xml_content = xml_content.encode()
             
             # Basic parsing - in real implementation, this would be more comprehensive
-            status = MachineStatus(
-                machine_id=self.machine_id,
-                state=MachineState.READY,  # Default state
-                timestamp=datetime.now(timezone.utc)
-            )
+            status = self._scratch_status()
             
-            # Parse device streams and data items
-            for device_stream in root.findall(".//{*}DeviceStream"):
-                for component_stream in device_stream.findall(".//{*}ComponentStream"):
-                    # Parse data items
-                    for sample in component_stream.findall(".//{*}Samples/*"):
-                        self._process_mtconnect_sample(sample, status)
-                    
-                    for event in component_stream.findall(".//{*}Events/*"):
-                        self._process_mtconnect_event(event, status)
+            # Single streaming pass: each Samples/Events container is handled
+            # as soon as it closes and then released, instead of building the
+            # whole tree and re-walking it with wildcard searches
+            if not self._apply_mtconnect_document(xml_content, status, self._container_names):
+                self._relearn_namespace(xml_content, status)
             
+            self._axis_names = status.axis_positions.names
             return status
             
         except Exception as e:
@@ -387,41 +932,154 @@ class MTConnectController(CNCController):
                 timestamp=datetime.now(timezone.utc)
             )
     
+    def _apply_mtconnect_document(
+        self,
+        xml_content: bytes,
+        status: MachineStatus,
+        container_names: Optional[Dict[str, str]]
+    ) -> bool:
+        """Fold a complete document into status; False if no Header matched."""
+        seen_header = False
+        for container, element in _iter_mtconnect_containers(xml_content, container_names):
+            seen_header = seen_header or container == "Header"
+            self._apply_mtconnect_container(container, element, status)
+        return seen_header
+    
+    def _relearn_namespace(self, xml_content: bytes, status: MachineStatus) -> None:
+        """Re-read a document whose namespace no longer matches the learned tags.
+        
+        Nothing from the document was applied (its Header did not match
+        either), so the same document is parsed again with wildcard tags
+        before status is published; the Header then re-learns the namespace.
+        """
+        if self._container_names is None:
+            return
+        self.logger.info("MTConnect namespace changed, re-learning container tags", machine_id=self.machine_id)
+        self._container_names = None
+        self._apply_mtconnect_document(xml_content, status, None)
+    
+    def _apply_mtconnect_container(self, container: str, element, status: MachineStatus) -> None:
+        """Fold one completed Header/Samples/Events element into status."""
+        if container == "Samples":
+            for sample in element:
+                self._process_mtconnect_sample(sample, status)
+        elif container == "Events":
+            for event in element:
+                self._process_mtconnect_event(event, status)
+        else:
+            self._next_sequence = element.get('nextSequence', self._next_sequence)
+            if self._container_names is None and element.tag.startswith('{'):
+                self._container_names = _mtconnect_container_names(element.tag[1:].partition('}')[0])
+        _release_element(element)
+    
+    async def _stream_samples(self) -> None:
+        """Follow the agent's /sample stream, falling back to /current polling."""
+        import aiohttp
+        
+        interval_ms = max(int(self.status_update_interval * 1000), 1)
+        heartbeat_ms = interval_ms * 10
+        # Single requests are bounded by request_timeout; a stream only needs
+        # to see a heartbeat now and then
+        stream_timeout = aiohttp.ClientTimeout(total=None, sock_read=heartbeat_ms * 3 / 1000)
+        
+        while not self._shutdown_event.is_set():
+            try:
+                # Seed from /current; the stream then resumes at its nextSequence
+                current = await self._poll_current()
+                if not current.success:
+                    await asyncio.sleep(self.status_update_interval)
+                    continue
+                
+                params = {"interval": interval_ms, "heartbeat": heartbeat_ms}
+                if self.device_uuid:
+                    params["device"] = self.device_uuid
+                if self._next_sequence:
+                    params["from"] = self._next_sequence
+                
+                session = await self._get_session()
+                async with session.get(self._sample_url, params=params, timeout=stream_timeout) as response:
+                    if response.status != 200 or not response.content_type.startswith("multipart/"):
+                        self.logger.warning(
+                            "MTConnect agent does not support streaming, polling /current",
+                            machine_id=self.machine_id,
+                            http_status=response.status
+                        )
+                        return
+                    
+                    self._stream_status = current.result
+                    reader = aiohttp.MultipartReader.from_response(response)
+                    while True:
+                        part = await reader.next()
+                        if part is None:
+                            break
+                        await self._consume_sample_part(part)
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"MTConnect sample stream error: {str(e)}")
+                await asyncio.sleep(self.status_update_interval)
+            finally:
+                # Until the stream is re-established, get_status polls /current
+                self._stream_status = None
+    
+    async def _consume_sample_part(self, part) -> None:
+        """Parse one streamed document incrementally as its chunks arrive."""
+        status = self._stream_status
+        container_names = self._container_names
+        parser = _mtconnect_pull_parser(container_names)
+        changed = False
+        # The Header comes first in a document; until it has matched, keep
+        # the raw chunks in case the learned namespace is out of date
+        pending: Optional[List[bytes]] = [] if container_names is not None else None
+        
+        while True:
+            chunk = await part.read_chunk()
+            if not chunk:
+                break
+            if pending is not None:
+                pending.append(chunk)
+            parser.feed(chunk)
+            for container, element in _read_mtconnect_containers(parser, container_names):
+                if container == "Header":
+                    pending = None
+                else:
+                    changed = True
+                self._apply_mtconnect_container(container, element, status)
+        parser.close()
+        
+        if pending:
+            self._relearn_namespace(b"".join(pending), status)
+            changed = True
+        
+        if changed:
+            status.timestamp = datetime.now(timezone.utc)
+            # Heartbeats carry no data items; real changes reach callbacks now
+            self.force_poll()
+    
     def _process_mtconnect_sample(self, sample, status: MachineStatus) -> None:
         """Process MTConnect sample data item."""
-        tag_name = sample.tag.split('}')[-1] if '}' in sample.tag else sample.tag
         value = sample.text
+        if not value:
+            return
         
-        if tag_name == "SpindleSpeed" and value:
-            if not status.spindle_status:
-                status.spindle_status = SpindleStatus(speed_rpm=0, load_percent=0)
-            status.spindle_status.speed_rpm = float(value)
-        elif tag_name == "Feedrate" and value:
-            status.feedrate = float(value)
-        elif tag_name.startswith("Position") and value:
-            axis_name = sample.get('name', tag_name)
-            status.axis_positions[axis_name] = AxisPosition(
-                axis_name=axis_name,
-                position=float(value)
-            )
+        tag_name = sample.tag.rpartition('}')[2]
+        handler = _MTCONNECT_SAMPLE_HANDLERS.get(tag_name)
+        if handler is not None:
+            handler(sample, tag_name, value, status)
+        elif tag_name.startswith(_POSITION_PREFIX):
+            _sample_position(sample, tag_name, value, status)
     
     def _process_mtconnect_event(self, event, status: MachineStatus) -> None:
         """Process MTConnect event data item."""
-        tag_name = event.tag.split('}')[-1] if '}' in event.tag else event.tag
         value = event.text
+        if not value:
+            return
         
-        if tag_name == "Execution" and value:
-            state_mapping = {
-                "ACTIVE": MachineState.ACTIVE,
-                "READY": MachineState.READY,
-                "STOPPED": MachineState.STOPPED,
-                "INTERRUPTED": MachineState.INTERRUPTED
-            }
-            status.state = state_mapping.get(value.upper(), MachineState.UNAVAILABLE)
-        elif tag_name == "EmergencyStop" and value:
-            status.emergency_stop_active = value.upper() == "ARMED"
-        elif tag_name == "Program" and value:
-            status.program_name = value
+        tag_name = event.tag.rpartition('}')[2]
+        handler = _MTCONNECT_EVENT_HANDLERS.get(tag_name)
+        if handler is not None:
+            handler(event, tag_name, value, status)
     
     async def send_command(self, command: CNCCommand, parameters: Optional[Dict[str, Any]] = None) -> OperationResult[bool]:
         """Send command via MTConnect (if supported by agent)."""
@@ -431,6 +1089,39 @@ class MTConnectController(CNCController):
             "Command sending not supported via MTConnect",
             error_code="NOT_SUPPORTED"
         )
+    
+    async def shutdown(self) -> OperationResult[bool]:
+        """Shutdown MTConnect controller."""
+        await self.disconnect()
+        return await super().shutdown()
+
+
+# Pushed fields that should reach status callbacks without waiting out the
+# monitor's idle interval
+_WAKE_FIELDS = frozenset({"execution", "emergency_stop"})
+
+
+class _OPCUASubscriptionHandler:
+    """Receives OPC-UA data change notifications on the client's thread."""
+    
+    def __init__(self, controller: "OPCUAController"):
+        self.controller = controller
+    
+    def datachange_notification(self, node, val, data):
+        controller = self.controller
+        field_name = controller._node_fields.get(node.nodeid)
+        if field_name is not None:
+            # Apply on the event loop so readers never see a half-updated status
+            controller._loop.call_soon_threadsafe(controller._apply_update, field_name, val)
+    
+    def status_change_notification(self, status):
+        # Sent by the client when the subscription stops being serviced
+        # (session closed, publish timeout); the pushed cache is dead from here
+        controller = self.controller
+        controller._loop.call_soon_threadsafe(controller._drop_status_cache, f"subscription status {status}")
+    
+    def event_notification(self, event):
+        pass
 
 
 class OPCUAController(CNCController):
@@ -443,6 +1134,33 @@ class OPCUAController(CNCController):
         self.username = connection_config.get('username')
         self.password = connection_config.get('password')
         
+        # Status field -> NodeId string. When present, the controller
+        # subscribes to these nodes and the server pushes changes, so
+        # get_status never has to read from the machine. With
+        # use_subscription off, each get_status reads all nodes in one
+        # batched request instead.
+        self.node_map: Dict[str, str] = connection_config.get('node_map', {})
+        self.use_subscription = connection_config.get('use_subscription', True)
+        self.publishing_interval_ms = connection_config.get(
+            'publishing_interval_ms', self.status_update_interval * 1000
+        )
+        self._nodes: List[Any] = []
+        self._fields: List[str] = []
+        self._subscription = None
+        self._node_fields: Dict[Any, str] = {}
+        self._status_cache: Optional[MachineStatus] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Pushes only arrive on change, so silence alone does not prove the
+        # session is alive: once the cache has gone this long without a
+        # notification, get_status re-reads all nodes before trusting it
+        self.max_status_age = connection_config.get('max_status_age', 10.0)
+        self._cache_verified_at = 0.0
+        
+        # CNCCommand value -> NodeId of a ByteString variable that accepts
+        # the command's JSON-encoded parameters, e.g.
+        # {"load_program": "ns=2;s=Program.Upload"}
+        self.command_nodes: Dict[str, str] = connection_config.get('command_nodes', {})
+        
     async def initialize(self) -> OperationResult[bool]:
         """Initialize OPC-UA client."""
         if OPCUAClient is None:
@@ -465,7 +1183,20 @@ class OPCUAController(CNCController):
                 self.client.set_user(self.username)
                 self.client.set_password(self.password)
             
-            await asyncio.get_event_loop().run_in_executor(None, self.client.connect)
+            await asyncio.get_event_loop().run_in_executor(self._executor, self.client.connect)
+            
+            if self.node_map:
+                self._loop = asyncio.get_running_loop()
+                await self._loop.run_in_executor(self._executor, self._resolve_nodes)
+                
+                if self.use_subscription:
+                    self._status_cache = MachineStatus(
+                        machine_id=self.machine_id,
+                        state=MachineState.READY,
+                        timestamp=datetime.now(timezone.utc)
+                    )
+                    self._cache_verified_at = time.monotonic()
+                    await self._loop.run_in_executor(self._executor, self._subscribe_nodes)
             
             return OperationResult.success_result(True, duration_ms=timer())
             
@@ -476,17 +1207,72 @@ class OPCUAController(CNCController):
                 duration_ms=timer()
             )
     
+    def _resolve_nodes(self) -> None:
+        """Resolve node_map NodeIds to node objects once per connection (blocking)."""
+        self._fields = list(self.node_map)
+        self._nodes = [self.client.get_node(self.node_map[name]) for name in self._fields]
+        self._node_fields = {node.nodeid: name for node, name in zip(self._nodes, self._fields)}
+    
+    def _subscribe_nodes(self) -> None:
+        """Create the data change subscription for every node in node_map (blocking)."""
+        self._subscription = self.client.create_subscription(
+            self.publishing_interval_ms, _OPCUASubscriptionHandler(self)
+        )
+        # One request for the whole node list; the server replies with the
+        # initial values, which arrive as ordinary notifications
+        self._subscription.subscribe_data_change(self._nodes)
+    
+    def _read_status(self) -> MachineStatus:
+        """Read every mapped node in one request and build a status (blocking)."""
+        values = self.client.get_values(self._nodes)
+        
+        status = self._scratch_status()
+        for field_name, value in zip(self._fields, values):
+            _apply_status_field(status, field_name, value)
+        self._axis_names = status.axis_positions.names
+        return status
+    
+    def _apply_update(self, field_name: str, value: Any) -> None:
+        """Fold a pushed value into the cached status (runs on the event loop)."""
+        try:
+            if self._status_cache is None:
+                return
+            _apply_status_field(self._status_cache, field_name, value)
+            self._status_cache.timestamp = datetime.now(timezone.utc)
+            self._cache_verified_at = time.monotonic()
+            if field_name in _WAKE_FIELDS:
+                self.force_poll()
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"Ignoring OPC-UA value for {field_name}: {str(e)}")
+    
+    def _drop_status_cache(self, reason: str) -> None:
+        """Stop serving pushed values; get_status reads the nodes instead."""
+        if self._status_cache is not None:
+            self.logger.warning(
+                "OPC-UA status cache invalidated",
+                machine_id=self.machine_id,
+                reason=reason
+            )
+        self._status_cache = None
+    
     async def disconnect(self) -> OperationResult[bool]:
         """Disconnect from OPC-UA server."""
+        # Whatever happens below, the last pushed values are no longer current
+        self._status_cache = None
         if self.client:
             try:
-                await asyncio.get_event_loop().run_in_executor(None, self.client.disconnect)
+                if self._subscription is not None:
+                    await asyncio.get_event_loop().run_in_executor(self._executor, self._subscription.delete)
+                await asyncio.get_event_loop().run_in_executor(self._executor, self.client.disconnect)
                 return OperationResult.success_result(True)
             except Exception as e:
                 return OperationResult.error_result(
                     f"OPC-UA disconnection error: {str(e)}",
                     error_code="DISCONNECTION_ERROR"
                 )
+            finally:
+                self._subscription = None
+                self.client = None
         return OperationResult.success_result(True)
     
     async def get_status(self) -> OperationResult[MachineStatus]:
@@ -499,7 +1285,35 @@ class OPCUAController(CNCController):
         
         timer = create_operation_timer()
         
+        if self._status_cache is not None:
+            if time.monotonic() - self._cache_verified_at <= self.max_status_age:
+                # Subscribed: the cache is kept current by the server's pushes.
+                # Hand out a snapshot so callers and history never share state.
+                return OperationResult.success_result(self._status_cache.snapshot(), duration_ms=timer())
+            
+            # Nothing pushed for a while: confirm the session with one batched
+            # read and re-seed the cache from it, or stop trusting the cache
+            try:
+                status = await asyncio.get_running_loop().run_in_executor(self._executor, self._read_status)
+            except Exception as e:
+                self._drop_status_cache(f"verification read failed: {str(e)}")
+                return OperationResult.error_result(
+                    f"Error reading OPC-UA status: {str(e)}",
+                    error_code="READ_ERROR",
+                    duration_ms=timer()
+                )
+            if self._status_cache is not None:
+                self._status_cache = status.snapshot()
+                self._cache_verified_at = time.monotonic()
+            return OperationResult.success_result(status, duration_ms=timer())
+        
         try:
+            if self._nodes:
+                # One executor hop and one Read request for all nodes; the
+                # parsing runs in the same hop
+                status = await asyncio.get_running_loop().run_in_executor(self._executor, self._read_status)
+                return OperationResult.success_result(status, duration_ms=timer())
+            
             # Read various status nodes
             status = MachineStatus(
                 machine_id=self.machine_id,
@@ -538,6 +1352,14 @@ class OPCUAController(CNCController):
                     # Write to emergency stop node
                     pass
             
+            node_id = self.command_nodes.get(command.value)
+            if node_id is not None and parameters:
+                # Encoded straight to bytes; no intermediate str
+                payload = _dumps(parameters)
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._write_command, node_id, payload
+                )
+            
             return OperationResult.success_result(True, duration_ms=timer())
             
         except Exception as e:
@@ -547,29 +1369,277 @@ class OPCUAController(CNCController):
                 duration_ms=timer()
             )
     
+    def _write_command(self, node_id: str, payload: bytes) -> None:
+        """Write an encoded command payload to its node (blocking)."""
+        node = self.client.get_node(node_id)
+        node.set_value(ua.Variant(payload, ua.VariantType.ByteString))
+    
     async def shutdown(self) -> OperationResult[bool]:
         """Shutdown OPC-UA controller."""
         await self.disconnect()
         return await super().shutdown()
 
 
+# Big-endian register types accepted in a Modbus register_map
+_MODBUS_TYPES = {
+    "uint16": struct.Struct(">H"),
+    "int16": struct.Struct(">h"),
+    "uint32": struct.Struct(">I"),
+    "int32": struct.Struct(">i"),
+    "float32": struct.Struct(">f"),
+}
+_MODBUS_MAX_READ = 125  # holding registers per request allowed by the protocol
+
+
+def _plan_reads(spans: List[Tuple[int, int]], max_count: int = _MODBUS_MAX_READ) -> List[Tuple[int, int]]:
+    """
+    Merge (address, register count) spans into contiguous (start, count) reads.
+    
+    Adjacent or overlapping spans share one request as long as it stays
+    within max_count registers; a gap in the address space starts a new read.
+    """
+    reads: List[Tuple[int, int]] = []
+    for address, count in sorted(spans):
+        if reads:
+            start, length = reads[-1]
+            end = max(start + length, address + count)
+            if address <= start + length and end - start <= max_count:
+                reads[-1] = (start, end - start)
+                continue
+        reads.append((address, count))
+    return reads
+
+
+def _modbus_unit_keyword(read: Callable[..., Any]) -> str:
+    """
+    Name of the unit id keyword taken by a pymodbus read method.
+    
+    pymodbus 3.0-3.9 call it ``slave``; later releases renamed it to
+    ``device_id``.
+    """
+    parameters = inspect.signature(read).parameters
+    return "device_id" if "device_id" in parameters else "slave"
+
+
+class ModbusController(CNCController):
+    """Modbus TCP implementation reading status from holding registers."""
+    
+    def __init__(self, component_id: str, machine_id: str, connection_config: Dict[str, Any], config: Optional[Dict[str, Any]] = None):
+        super().__init__(component_id, machine_id, ProtocolType.MODBUS, connection_config, config)
+        self.host = connection_config.get('host', 'localhost')
+        self.port = connection_config.get('port', 502)
+        self.unit_id = connection_config.get('unit_id', 1)
+        self.request_timeout = connection_config.get('request_timeout', 2.0)
+        
+        # Status field -> holding register, either an address (uint16) or
+        # {"address": int, "type": "float32", "scale": 0.1}. Field names are
+        # the same as an OPC-UA node_map.
+        self.register_map: Dict[str, Any] = connection_config.get('register_map', {})
+        # Numeric Execution register values -> MTConnect execution names
+        # (keys may arrive as strings from JSON/YAML config)
+        self.execution_codes: Dict[int, str] = {
+            int(code): name for code, name in connection_config.get('execution_codes', {}).items()
+        }
+        self.client: Optional[AsyncModbusTcpClient] = None
+        
+        # Planned once on connect: the reads to issue per poll, and for
+        # each field its register offset within the joined read buffer
+        self._reads: List[Tuple[int, int]] = []
+        self._decoders: List[Tuple[str, int, struct.Struct, float]] = []
+        self._unit_keyword = "slave"
+    
+    async def initialize(self) -> OperationResult[bool]:
+        """Initialize Modbus client."""
+        if AsyncModbusTcpClient is None:
+            return OperationResult.error_result(
+                "Modbus library not available. Install pymodbus package.",
+                error_code="MISSING_DEPENDENCY"
+            )
+        
+        self.set_state(ComponentState.READY, "Modbus controller initialized")
+        return OperationResult.success_result(True)
+    
+    async def connect(self) -> OperationResult[bool]:
+        """Connect to the Modbus TCP server."""
+        timer = create_operation_timer()
+        
+        try:
+            self.client = AsyncModbusTcpClient(self.host, port=self.port, timeout=self.request_timeout)
+            await self.client.connect()
+            if not self.client.connected:
+                return OperationResult.error_result(
+                    f"Modbus connection to {self.host}:{self.port} failed",
+                    error_code="CONNECTION_FAILED",
+                    duration_ms=timer()
+                )
+            
+            self._unit_keyword = _modbus_unit_keyword(self.client.read_holding_registers)
+            self._plan_register_reads()
+            return OperationResult.success_result(True, duration_ms=timer())
+            
+        except Exception as e:
+            return OperationResult.error_result(
+                f"Modbus connection failed: {str(e)}",
+                error_code="CONNECTION_FAILED",
+                duration_ms=timer()
+            )
+    
+    def _plan_register_reads(self) -> None:
+        """Group register_map into as few range reads as possible."""
+        fields = []
+        for field_name, spec in self.register_map.items():
+            if not isinstance(spec, dict):
+                spec = {"address": spec}
+            decoder = _MODBUS_TYPES[spec.get("type", "uint16")]
+            fields.append((field_name, int(spec["address"]), decoder, float(spec.get("scale", 1.0))))
+        
+        self._reads = _plan_reads([(address, decoder.size // 2) for _, address, decoder, _ in fields])
+        
+        # Registers of all reads are concatenated in read order, so a field's
+        # offset is its position within its read plus the preceding lengths
+        bases = []
+        offset = 0
+        for start, count in self._reads:
+            bases.append((start, count, offset))
+            offset += count
+        
+        self._decoders = []
+        for field_name, address, decoder, scale in fields:
+            for start, count, base in bases:
+                if start <= address < start + count:
+                    self._decoders.append((field_name, (base + address - start) * 2, decoder, scale))
+                    break
+    
+    async def disconnect(self) -> OperationResult[bool]:
+        """Disconnect from the Modbus TCP server."""
+        if self.client:
+            try:
+                self.client.close()
+            except Exception as e:
+                self.logger.warning(f"Error disconnecting from Modbus server: {str(e)}")
+            finally:
+                self.client = None
+        return OperationResult.success_result(True)
+    
+    async def get_status(self) -> OperationResult[MachineStatus]:
+        """Read all mapped registers with one request per contiguous range."""
+        if not self.client:
+            return OperationResult.error_result(
+                "Not connected to Modbus server",
+                error_code="NOT_CONNECTED"
+            )
+        
+        timer = create_operation_timer()
+        
+        try:
+            registers: List[int] = []
+            unit = {self._unit_keyword: self.unit_id}
+            for start, count in self._reads:
+                response = await self.client.read_holding_registers(start, count=count, **unit)
+                if response.isError():
+                    return OperationResult.error_result(
+                        f"Modbus read of {count} registers at {start} failed: {response}",
+                        error_code="READ_ERROR",
+                        duration_ms=timer()
+                    )
+                registers.extend(response.registers)
+            
+            # One big-endian buffer for the whole poll; each field is an
+            # unpack_from at its precomputed byte offset
+            buffer = struct.pack(f">{len(registers)}H", *registers)
+            status = self._scratch_status()
+            for field_name, offset, decoder, scale in self._decoders:
+                value = decoder.unpack_from(buffer, offset)[0]
+                if field_name == "execution":
+                    value = self.execution_codes.get(value, "UNAVAILABLE")
+                elif field_name == "emergency_stop":
+                    value = bool(value)
+                elif scale != 1.0:
+                    value *= scale
+                _apply_status_field(status, field_name, value)
+            self._axis_names = status.axis_positions.names
+            
+            return OperationResult.success_result(status, duration_ms=timer())
+            
+        except Exception as e:
+            return OperationResult.error_result(
+                f"Error reading Modbus status: {str(e)}",
+                error_code="READ_ERROR",
+                duration_ms=timer()
+            )
+    
+    async def send_command(self, command: CNCCommand, parameters: Optional[Dict[str, Any]] = None) -> OperationResult[bool]:
+        """Send command via Modbus."""
+        # Command interfaces over Modbus are vendor-specific PLC mappings
+        return OperationResult.error_result(
+            "Command sending not supported via Modbus",
+            error_code="NOT_SUPPORTED"
+        )
+    
+    async def shutdown(self) -> OperationResult[bool]:
+        """Shutdown Modbus controller."""
+        await self.disconnect()
+        return await super().shutdown()
+
+
+def run_event_loop(main: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine to completion on a new event loop, uvloop when installed.
+    
+    Drop-in replacement for asyncio.run() at program entry points. The loop
+    is created directly, so no global event loop policy is installed.
+    """
+    # uvloop.run() arrived in uvloop 0.18
+    if uvloop is None or not hasattr(uvloop, "run"):
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
 class CNCManager(BaseAsyncComponent):
     """Central manager for multiple CNC machines."""
     
     def __init__(self, component_id: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(component_id, "CNCManager", config)
         self.controllers: Dict[str, CNCController] = {}
-        self.status_history: Dict[str, List[MachineStatus]] = {}
+        self.status_history: Dict[str, Deque[MachineStatus]] = {}
         self.max_history_size = config.get('max_history_size', 1000) if config else 1000
+        
+        # Shared by every managed controller: one HTTP connection pool and
+        # one thread pool for blocking protocol clients
+        self._http_session = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.get('executor_workers', 8) if config else 8,
+            thread_name_prefix="cnc"
+        )
+    
+    async def _get_http_session(self):
+        """Return the shared HTTP session, creating it on first use."""
+        if self._http_session is None or self._http_session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=8,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
     
     async def initialize(self) -> OperationResult[bool]:
         """Initialize CNC manager."""
+        if uvloop is not None and not isinstance(asyncio.get_running_loop(), uvloop.Loop):
+            # Too late to switch here; the loop already exists
+            self.logger.info("uvloop is available but not in use; start the program with run_event_loop()")
+        
         self.set_state(ComponentState.READY, "CNC manager initialized")
         return OperationResult.success_result(True)
     
     async def add_controller(self, controller: CNCController) -> OperationResult[bool]:
         """Add a CNC controller to management."""
         try:
+            session = await self._get_http_session() if isinstance(controller, MTConnectController) else None
+            controller.bind_shared(session=session, executor=self._executor)
+            
             # Initialize controller
             init_result = await controller.initialize()
             if not init_result.success:
@@ -582,7 +1652,7 @@ class CNCManager(BaseAsyncComponent):
             
             # Add to management
             self.controllers[controller.machine_id] = controller
-            self.status_history[controller.machine_id] = []
+            self.status_history[controller.machine_id] = deque(maxlen=self.max_history_size)
             
             # Add status callback
             controller.add_status_callback(self._on_status_update)
@@ -603,14 +1673,12 @@ class CNCManager(BaseAsyncComponent):
         """Handle status updates from controllers."""
         machine_id = status.machine_id
         
-        # Add to history
+        # Add to history; the bounded deque drops the oldest entry itself
         if machine_id in self.status_history:
-            history = self.status_history[machine_id]
-            history.append(status)
-            
-            # Limit history size
-            if len(history) > self.max_history_size:
-                history.pop(0)
+            if self.controllers[machine_id].reuse_status_buffers:
+                # The controller overwrites this object two polls from now
+                status = status.snapshot()
+            self.status_history[machine_id].append(status)
     
     async def get_all_status(self) -> OperationResult[Dict[str, MachineStatus]]:
         """Get current status of all managed machines."""
@@ -645,6 +1713,11 @@ class CNCManager(BaseAsyncComponent):
             except Exception as e:
                 self.logger.error(f"Error shutting down controller: {str(e)}")
         
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+        self._executor.shutdown(wait=False)
+        
         return await super().shutdown()
 
 
@@ -654,6 +1727,7 @@ __all__ = [
     'CNCCommand',
     'ProtocolType',
     'AxisPosition',
+    'AxisPositions',
     'ToolInfo',
     'SpindleStatus',
     'MachineStatus',
@@ -661,5 +1735,7 @@ __all__ = [
     'CNCController',
     'MTConnectController',
     'OPCUAController',
-    'CNCManager'
+    'ModbusController',
+    'CNCManager',
+    'run_event_loop'
 ]
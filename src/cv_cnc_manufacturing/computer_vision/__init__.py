@@ -36,7 +36,8 @@ from ..core.base import (
     ManufacturingException,
     QualityException,
     safety_context,
-    create_operation_timer
+    create_operation_timer,
+    DATACLASS_SLOTS
 )
 
 
@@ -80,7 +81,7 @@ class ImageMetadata:
     operator: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BoundingBox:
     """Bounding box for detected objects or defects."""
     x: float
@@ -100,7 +101,7 @@ class BoundingBox:
         return self.width * self.height
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DefectDetection:
     """Detected defect information."""
     defect_type: DefectType
@@ -113,7 +114,7 @@ class DefectDetection:
     detection_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QualityMeasurement:
     """Quality measurement result."""
     measurement_type: str
@@ -442,6 +443,23 @@ class QualityInspector(BaseAsyncComponent):
                     duration_ms=timer()
                 )
     
+    async def inspect_batch(
+        self,
+        images: List[np.ndarray],
+        part_ids: List[str]
+    ) -> List[OperationResult[InspectionReport]]:
+        """
+        Inspect several parts in one call, returning one result per image.
+        
+        This is the entry point for micro-batching callers such as the API.
+        The classical OpenCV pipeline works image by image; a model-backed
+        detector should stack the images here and run a single forward pass.
+        """
+        return [
+            await self.inspect_part(image, part_id)
+            for image, part_id in zip(images, part_ids)
+        ]
+    
     async def _perform_measurements(self, image: np.ndarray) -> List[QualityMeasurement]:
         """Perform dimensional and surface measurements."""
         measurements = []
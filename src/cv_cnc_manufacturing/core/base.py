@@ -12,6 +12,7 @@ deployment in manufacturing environments.
 import abc
 import asyncio
 import logging
+import sys
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -60,6 +61,11 @@ else:
 T = TypeVar('T')
 ResultType = TypeVar('ResultType')
 
+# Keyword arguments for @dataclass on value types created in hot paths;
+# slots=True (Python 3.10+) drops the per-instance __dict__ and speeds up
+# attribute access
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ComponentState(Enum):
     """Enumeration of possible component states in the manufacturing system."""
@@ -551,5 +557,6 @@ __all__ = [
     'ComputerVisionProcessorProtocol',
     'create_operation_timer',
     'safety_context',
-    'validate_manufacturing_compliance'
+    'validate_manufacturing_compliance',
+    'DATACLASS_SLOTS'
 ]
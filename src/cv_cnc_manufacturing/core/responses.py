@@ -0,0 +1,36 @@
+"""
+HTTP response classes shared by the platform's web services.
+
+The API package and the standalone ``main.py`` / ``demo_app.py`` servers
+render JSON through the same class, so payloads are encoded identically
+everywhere. Kept in ``core`` because the minimal deployment image ships
+only the ``core`` and ``api`` packages.
+"""
+
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+# orjson's C encoder handles datetime/UUID/numpy natively and is several
+# times faster than stdlib json on the dict-heavy status payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Options for every orjson encode in the web layer (responses and WebSocket
+# frames): int-keyed dicts and numpy values are accepted like stdlib json
+# accepted them before
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            raise RuntimeError("orjson must be installed to use ORJSONResponse")
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+__all__ = ['ORJSON_OPTIONS', 'ORJSONResponse']
@@ -0,0 +1,75 @@
+async function makeRequest(endpoint) {
+    try {
+        const response = await fetch(endpoint);
+        const data = await response.json();
+        return data;
+    } catch (error) {
+        return { error: error.message };
+    }
+}
+
+function displayOutput(data) {
+    document.getElementById('output').textContent = JSON.stringify(data, null, 2);
+}
+
+async function runQualityInspection() {
+    displayOutput({ status: "Starting quality inspection..." });
+    const result = await makeRequest('/api/quality/inspect');
+    displayOutput(result);
+}
+
+async function getManufacturingStatus() {
+    displayOutput({ status: "Fetching manufacturing status..." });
+    const result = await makeRequest('/api/manufacturing/status');
+    displayOutput(result);
+    updateDashboardStats(result);
+}
+
+async function getPerformanceAnalytics() {
+    displayOutput({ status: "Generating performance analytics..." });
+    const result = await makeRequest('/api/analytics/performance');
+    displayOutput(result);
+}
+
+async function simulateDefectDetection() {
+    displayOutput({ status: "Running AI defect detection..." });
+    const result = await makeRequest('/api/quality/inspect');
+    if (result.defects && result.defects.length > 0) {
+        displayOutput({
+            alert: "DEFECT DETECTED!",
+            details: result
+        });
+    } else {
+        setTimeout(async () => {
+            // Force a defect for demo
+            const defectResult = await makeRequest('/api/quality/inspect?force_defect=true');
+            displayOutput({
+                alert: "DEFECT DETECTED!",
+                details: defectResult
+            });
+        }, 1000);
+    }
+}
+
+function updateDashboardStats(data) {
+    if (data.total_parts_today) {
+        document.getElementById('totalParts').textContent = data.total_parts_today.toLocaleString();
+    }
+    if (data.overall_efficiency) {
+        document.getElementById('efficiency').textContent = data.overall_efficiency + '%';
+    }
+    if (data.machines && data.machines.length > 0) {
+        const avgQuality = data.machines.reduce((sum, m) => sum + m.quality_score, 0) / data.machines.length;
+        document.getElementById('qualityScore').textContent = avgQuality.toFixed(1) + '%';
+
+        const activeMachines = data.machines.filter(m => m.status === 'RUNNING').length;
+        document.getElementById('activeMachines').textContent = activeMachines + '/' + data.machines.length;
+    }
+}
+
+// Initialize dashboard
+window.addEventListener('load', () => {
+    // One long-lived server-sent events stream replaces periodic polling
+    const statusStream = new EventSource('/api/manufacturing/stream');
+    statusStream.onmessage = (event) => updateDashboardStats(JSON.parse(event.data));
+});
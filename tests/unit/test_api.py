@@ -0,0 +1,245 @@
+"""
+Unit tests for the manufacturing API routes.
+
+Requests go through FastAPI's TestClient against a ManufacturingAPI with no
+platform components started; only the request handling is exercised.
+"""
+
+import asyncio
+import base64
+
+import numpy as np
+import pytest
+
+from cv_cnc_manufacturing import api as api_module
+from cv_cnc_manufacturing.api import ManufacturingAPI
+from cv_cnc_manufacturing.core.base import ManufacturingEvent, OperationResult
+from cv_cnc_manufacturing.core.responses import ORJSONResponse
+
+TestClient = pytest.importorskip("fastapi.testclient").TestClient
+
+
+NOT_AN_IMAGE = b"this is not an encoded image"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """API client with a quality inspector present but never reached."""
+    if api_module.cv2 is None:
+        # cv2.imdecode returns None for bytes it cannot decode
+        monkeypatch.setattr(api_module, "_decode_image_bytes", lambda image_bytes, scale=1: None)
+
+    server = ManufacturingAPI("test_api", {"enable_docs": False})
+    server.quality_inspector = object()
+    server.app.dependency_overrides[api_module.get_current_user] = lambda: {
+        "user_id": "inspector", "permissions": ["quality_inspect"]
+    }
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+class TestQualityInspectErrors:
+    """Client errors raised inside the inspection handlers keep their status."""
+
+    @pytest.mark.unit
+    def test_undecodable_base64_image_is_rejected(self, client):
+        response = client.post(
+            "/api/v1/quality/inspect",
+            json={"part_id": "P-1", "image_data": base64.b64encode(NOT_AN_IMAGE).decode()},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid image data"
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not api_module.HAS_MULTIPART, reason="python-multipart not installed")
+    def test_undecodable_upload_is_rejected(self, client):
+        response = client.post(
+            "/api/v1/quality/inspect_raw",
+            files={"image": ("part.jpg", NOT_AN_IMAGE, "image/jpeg")},
+            data={"part_id": "P-1"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid image data"
+
+
+class _RecordingWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, payload):
+        self.frames.append(payload)
+
+
+class _UnreachableRedis:
+    async def xadd(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+
+class _MemoryStream:
+    """Single Redis stream kept in memory, with XADD/XREVRANGE/XREAD."""
+
+    def __init__(self):
+        self.entries = []
+
+    async def xadd(self, stream, fields, **kwargs):
+        message_id = f"{len(self.entries) + 1}-0"
+        self.entries.append((message_id, {key: str(value) for key, value in fields.items()}))
+        return message_id
+
+    async def xrevrange(self, stream, count=None):
+        return self.entries[-1:][:count]
+
+    async def xread(self, streams, block=None, count=None):
+        (stream, last_id), = streams.items()
+        after = 0 if last_id == "0-0" else int(last_id.split("-")[0])
+        newer = self.entries[after:]
+        if not newer:
+            await asyncio.sleep(0.01)
+            return []
+        return [(stream, newer[:count])]
+
+
+class TestEventBroadcast:
+    """Events still reach this worker's subscribers when Redis is down."""
+
+    @pytest.mark.unit
+    def test_failed_stream_publish_delivers_locally(self):
+        server = ManufacturingAPI("test_api", {"enable_docs": False, "redis_url": "redis://unused"})
+        server._redis = _UnreachableRedis()
+        websocket = _RecordingWebSocket()
+        server.websocket_connections[id(websocket)] = websocket
+        server._unfiltered.add(id(websocket))
+
+        asyncio.run(server._broadcast_event(
+            ManufacturingEvent(event_type="quality_inspection_completed", source_component="api")
+        ))
+
+        assert len(websocket.frames) == 1
+        assert "quality_inspection_completed" in websocket.frames[0]
+
+    @pytest.mark.unit
+    def test_event_published_before_first_relay_read_is_delivered(self):
+        async def scenario():
+            server = ManufacturingAPI("test_api", {"enable_docs": False, "redis_url": "redis://unused"})
+            server._redis = _MemoryStream()
+            await server._redis.xadd(server.event_stream, {"event_type": "old", "source_component": "api",
+                                                          "priority": 3, "data": "old"})
+            websocket = _RecordingWebSocket()
+            server.websocket_connections[id(websocket)] = websocket
+            server._unfiltered.add(id(websocket))
+
+            # Seeded as at startup, then an event is published before the
+            # relay task has issued its first XREAD
+            relay = server._relay_stream_events(await server._stream_last_id())
+            await server._broadcast_event(ManufacturingEvent(event_type="startup", source_component="api"))
+
+            task = asyncio.ensure_future(relay)
+            for _ in range(100):
+                if websocket.frames:
+                    break
+                await asyncio.sleep(0.01)
+            task.cancel()
+            return websocket.frames
+
+        frames = asyncio.run(scenario())
+
+        assert len(frames) == 1  # the new event, not the pre-existing one
+        assert "startup" in frames[0]
+
+
+class _BatchRecordingInspector:
+    """Quality inspector stub that records the size of each batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def inspect_batch(self, images, part_ids):
+        self.batches.append(len(images))
+        return [OperationResult.success_result(part_id) for part_id in part_ids]
+
+
+class _ShortBatchInspector(_BatchRecordingInspector):
+    """Inspector whose batch call drops the last result."""
+
+    async def inspect_batch(self, images, part_ids):
+        return (await super().inspect_batch(images, part_ids))[:-1]
+
+
+class TestInspectionBatching:
+    """Queued inspections do not hold admission slots."""
+
+    @pytest.mark.unit
+    def test_batch_fills_past_admission_limit(self):
+        async def scenario():
+            server = ManufacturingAPI("test_api", {
+                "enable_docs": False,
+                "max_concurrent_inspections": 1,
+                "inspect_max_batch": 3,
+                "inspect_max_wait_ms": 5000.0,
+            })
+            server.quality_inspector = _BatchRecordingInspector()
+
+            async def request(part_id):
+                async with server._admit_inspection() as release_slot:
+                    return await server._inspect(object(), part_id, release_slot)
+
+            results = await asyncio.wait_for(
+                asyncio.gather(*(request(f"P-{i}") for i in range(3))), timeout=2.0
+            )
+            await server.shutdown()
+            return server, results
+
+        server, results = asyncio.run(scenario())
+
+        assert [result.result for result in results] == ["P-0", "P-1", "P-2"]
+        assert server.quality_inspector.batches == [3]
+        assert not server._inspect_slots.locked()
+
+    @pytest.mark.unit
+    def test_short_batch_result_fails_every_request(self):
+        async def scenario():
+            server = ManufacturingAPI("test_api", {
+                "enable_docs": False,
+                "inspect_max_batch": 2,
+                "inspect_max_wait_ms": 5000.0,
+            })
+            server.quality_inspector = _ShortBatchInspector()
+
+            async def request(part_id):
+                async with server._admit_inspection() as release_slot:
+                    return await server._inspect(object(), part_id, release_slot)
+
+            outcomes = await asyncio.wait_for(
+                asyncio.gather(request("P-0"), request("P-1"), return_exceptions=True), timeout=2.0
+            )
+            await server.shutdown()
+            return outcomes
+
+        outcomes = asyncio.run(scenario())
+
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+        assert "1 results for 2 images" in str(outcomes[0])
+
+
+class TestJSONEncoding:
+    """Responses and WebSocket frames share one set of orjson options."""
+
+    @pytest.mark.unit
+    def test_renders_numpy_values_and_int_keys(self):
+        pytest.importorskip("orjson")
+        response = ORJSONResponse({1: np.float64(2.5), "axes": np.array([1, 2])})
+
+        assert response.body == b'{"1":2.5,"axes":[1,2]}'
+        assert response.media_type == "application/json"
+
+    @pytest.mark.unit
+    def test_event_frame_accepts_numpy_values_and_int_keys(self):
+        pytest.importorskip("orjson")
+        event = ManufacturingEvent(event_type="measurement", data={"score": np.float64(0.5), 3: "x"})
+
+        frame = ManufacturingAPI._event_payload(event)
+
+        assert '"score":0.5' in frame
+        assert '"3":"x"' in frame
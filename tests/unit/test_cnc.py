@@ -0,0 +1,451 @@
+"""
+Unit tests for CNC controller status handling.
+
+Covers status snapshots, buffer reuse and history retention without any
+machine connection; protocol clients are replaced with in-memory stubs.
+"""
+
+import asyncio
+import struct
+import time
+from collections import deque
+
+import pytest
+
+from cv_cnc_manufacturing.cnc import (
+    CNCController,
+    CNCManager,
+    MachineState,
+    MachineStatus,
+    ModbusController,
+    MTConnectController,
+    OPCUAController,
+    ProtocolType,
+    _OPCUASubscriptionHandler,
+    _modbus_unit_keyword,
+    _plan_reads,
+    run_event_loop,
+)
+from cv_cnc_manufacturing.core.base import OperationResult
+
+
+MTCONNECT_NS = "urn:mtconnect.org:MTConnectStreams:1.3"
+
+
+def mtconnect_document(body: str, next_sequence: int = 1, namespace: str = MTCONNECT_NS) -> bytes:
+    """Build a minimal MTConnectStreams document around a DeviceStream body."""
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<MTConnectStreams xmlns="{namespace}">'
+        f'<Header nextSequence="{next_sequence}"/>'
+        f'<Streams><DeviceStream name="d" uuid="u"><ComponentStream component="Path" name="p">'
+        f'{body}'
+        f'</ComponentStream></DeviceStream></Streams></MTConnectStreams>'
+    ).encode()
+
+
+def spindle_document(speed_rpm: float, execution: str = "ACTIVE") -> bytes:
+    return mtconnect_document(
+        f"<Samples><SpindleSpeed>{speed_rpm}</SpindleSpeed><Position name=\"X\">1.5</Position></Samples>"
+        f"<Events><Execution>{execution}</Execution></Events>"
+    )
+
+
+class TestStatusBufferReuse:
+    """Statuses kept in history must not change when the controller polls again."""
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_history_entry_survives_buffer_reuse(self):
+        controller = MTConnectController(
+            "mt", "m1", {}, {"reuse_status_buffers": True}
+        )
+        manager = CNCManager("manager")
+        manager.controllers["m1"] = controller
+        manager.status_history["m1"] = deque(maxlen=10)
+
+        first = controller._parse_mtconnect_status(spindle_document(900))
+        manager._on_status_update(first)
+
+        # Two more polls cycle back onto the buffer that produced `first`
+        for _ in range(2):
+            manager._on_status_update(controller._parse_mtconnect_status(spindle_document(1500)))
+
+        stored = manager.status_history["m1"][0]
+        assert stored.spindle_status.speed_rpm == 900
+        assert stored.axis_positions.axis("X") == 1.5
+        assert first.spindle_status.speed_rpm == 1500  # the buffer itself was reused
+
+        asyncio.run(manager.shutdown())
+
+    @pytest.mark.unit
+    def test_snapshot_copies_nested_objects(self):
+        controller = MTConnectController("mt", "m1", {})
+        status = controller._parse_mtconnect_status(spindle_document(900))
+
+        copy = status.snapshot()
+        status.spindle_status.speed_rpm = 1500
+        status.axis_positions.set("X", 9.0)
+        status.alarms.append("overload")
+
+        assert copy.state == MachineState.ACTIVE
+        assert copy.spindle_status.speed_rpm == 900
+        assert copy.spindle_status is not status.spindle_status
+        assert copy.axis_positions.axis("X") == 1.5
+        assert copy.alarms == []
+
+
+class _StubPart:
+    """Multipart body that hands out a streamed document in fixed-size chunks."""
+
+    def __init__(self, document: bytes, chunk_size: int = 64):
+        self._chunks = [document[i:i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+    async def read_chunk(self) -> bytes:
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class TestMTConnectStreaming:
+    """The /sample stream updates a cached status that callers must not share."""
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_streamed_sample_does_not_change_returned_status(self):
+        async def scenario():
+            controller = MTConnectController("mt", "m1", {})
+            controller._stream_status = controller._parse_mtconnect_status(spindle_document(900))
+
+            returned = (await controller.get_status()).result
+            await controller._consume_sample_part(_StubPart(spindle_document(1500)))
+            latest = (await controller.get_status()).result
+
+            await controller.shutdown()
+            return returned, latest
+
+        returned, latest = asyncio.run(scenario())
+
+        assert returned.spindle_status.speed_rpm == 900
+        assert latest.spindle_status.speed_rpm == 1500
+
+
+class TestMTConnectNamespaceChange:
+    """A new agent namespace is re-learned without publishing a blank status."""
+
+    NEW_NS = "urn:mtconnect.org:MTConnectStreams:1.4"
+
+    def _document(self, speed_rpm, namespace):
+        return mtconnect_document(
+            f"<Samples><SpindleSpeed>{speed_rpm}</SpindleSpeed></Samples>"
+            f"<Events><Execution>ACTIVE</Execution></Events>",
+            namespace=namespace
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_current_document_with_new_namespace(self):
+        controller = MTConnectController("mt", "m1", {})
+        controller._parse_mtconnect_status(self._document(900, MTCONNECT_NS))
+        assert f"{{{MTCONNECT_NS}}}Header" in controller._container_names
+
+        status = controller._parse_mtconnect_status(self._document(1500, self.NEW_NS))
+
+        assert status.state == MachineState.ACTIVE
+        assert status.spindle_status.speed_rpm == 1500
+        assert f"{{{self.NEW_NS}}}Header" in controller._container_names
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_streamed_document_with_new_namespace(self):
+        async def scenario():
+            controller = MTConnectController("mt", "m1", {})
+            controller._stream_status = controller._parse_mtconnect_status(self._document(900, MTCONNECT_NS))
+            await controller._consume_sample_part(_StubPart(self._document(1500, self.NEW_NS)))
+            status = (await controller.get_status()).result
+            await controller.shutdown()
+            return controller, status
+
+        controller, status = asyncio.run(scenario())
+
+        assert status.state == MachineState.ACTIVE
+        assert status.spindle_status.speed_rpm == 1500
+        assert f"{{{self.NEW_NS}}}Header" in controller._container_names
+
+
+class _StubOPCUAClient:
+    """OPC-UA client whose batched read returns fixed values or fails."""
+
+    def __init__(self, values):
+        self.values = values
+        self.reads = 0
+        self.disconnected = False
+
+    def get_values(self, nodes):
+        self.reads += 1
+        if isinstance(self.values, Exception):
+            raise self.values
+        return list(self.values)
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def subscribed_opcua_controller(values, **connection_config):
+    """OPC-UA controller in the subscribed state, with a cached status."""
+    controller = OPCUAController("opc", "m1", {"node_map": {"execution": "ns=2;s=Exec", "feedrate": "ns=2;s=Feed"}, **connection_config})
+    controller.client = _StubOPCUAClient(values)
+    controller._fields = ["execution", "feedrate"]
+    controller._nodes = ["exec-node", "feed-node"]
+    controller._status_cache = MachineStatus(machine_id="m1", state=MachineState.ACTIVE, feedrate=100.0)
+    return controller
+
+
+class TestOPCUAStatusCache:
+    """Pushed values are only served while the session is known to be alive."""
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_fresh_cache_is_served_without_reading(self):
+        async def scenario():
+            controller = subscribed_opcua_controller(["READY", 50.0])
+            controller._loop = asyncio.get_running_loop()
+            controller._cache_verified_at = time.monotonic()
+            result = await controller.get_status()
+            return controller, result
+
+        controller, result = asyncio.run(scenario())
+        assert result.success
+        assert result.result.feedrate == 100.0
+        assert controller.client.reads == 0
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_stale_cache_falls_back_to_batched_read(self):
+        async def scenario():
+            controller = subscribed_opcua_controller(["READY", 50.0], max_status_age=0.5)
+            controller._cache_verified_at = time.monotonic() - 1.0
+            result = await controller.get_status()
+            return controller, result
+
+        controller, result = asyncio.run(scenario())
+        assert result.success
+        assert result.result.state == MachineState.READY
+        assert result.result.feedrate == 50.0
+        assert controller.client.reads == 1
+        # The read re-seeds the cache, which is trusted again
+        assert controller._status_cache.feedrate == 50.0
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_failed_verification_drops_cache(self):
+        async def scenario():
+            controller = subscribed_opcua_controller(ConnectionError("link down"))
+            controller._cache_verified_at = 0.0
+            first = await controller.get_status()
+            second = await controller.get_status()
+            return controller, first, second
+
+        controller, first, second = asyncio.run(scenario())
+        assert not first.success
+        assert not second.success  # no stale values after the failure either
+        assert controller._status_cache is None
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_disconnect_and_subscription_loss_clear_cache(self):
+        async def scenario():
+            controller = subscribed_opcua_controller(["READY", 50.0])
+            controller._loop = asyncio.get_running_loop()
+            controller._cache_verified_at = time.monotonic()
+
+            # Subscription reported dead by the client thread
+            _OPCUASubscriptionHandler(controller).status_change_notification("BadTimeout")
+            await asyncio.sleep(0)
+            lost_cache = controller._status_cache
+
+            client = controller.client
+            await controller.disconnect()
+            result = await controller.get_status()
+            return controller, client, lost_cache, result
+
+        controller, client, lost_cache, result = asyncio.run(scenario())
+        assert lost_cache is None
+        assert client.disconnected
+        assert controller.client is None
+        assert result.error_code == "NOT_CONNECTED"
+
+
+class _ScriptedController(CNCController):
+    """Controller that replays a fixed list of statuses and records poll waits."""
+
+    def __init__(self, statuses):
+        super().__init__("scripted", "m1", ProtocolType.OPCUA, {}, {"status_update_interval": 0.1, "idle_interval": 5.0})
+        self.statuses = list(statuses)
+        self.waits = []
+
+    async def initialize(self):
+        return OperationResult.success_result(True)
+
+    async def connect(self):
+        return OperationResult.success_result(True)
+
+    async def disconnect(self):
+        return OperationResult.success_result(True)
+
+    async def send_command(self, command, parameters=None):
+        return OperationResult.success_result(True)
+
+    async def get_status(self):
+        return OperationResult.success_result(self.statuses.pop(0))
+
+    async def _wait_for_poll(self, interval):
+        self.waits.append(interval)
+        if not self.statuses:
+            self._shutdown_event.set()
+
+
+class TestMonitorPollRate:
+    """Poll rate follows the same status signature that gates callbacks."""
+
+    @pytest.mark.unit
+    def test_fast_poll_on_any_signature_change(self):
+        def status(**fields):
+            return MachineStatus(machine_id="m1", state=MachineState.ACTIVE, **fields)
+
+        controller = _ScriptedController([
+            status(feedrate=100.0),
+            status(feedrate=100.0),
+            status(feedrate=120.0),                             # feedrate only
+            status(feedrate=120.0),
+            status(feedrate=120.0, emergency_stop_active=True),  # e-stop only
+            status(feedrate=120.0, emergency_stop_active=True, alarms=["overload"]),
+            status(feedrate=120.0, emergency_stop_active=True, alarms=["overload"]),  # unchanged, alarm active
+        ])
+        asyncio.run(controller._monitor_status())
+
+        assert controller.waits == [0.1, 5.0, 0.1, 5.0, 0.1, 0.1, 0.1]
+
+    @pytest.mark.unit
+    def test_idle_poll_for_unchanged_armed_machine(self):
+        # MTConnect reports EmergencyStop ARMED on a healthy machine
+        document = mtconnect_document(
+            "<Events><Execution>READY</Execution><EmergencyStop>ARMED</EmergencyStop></Events>"
+        )
+        parser = MTConnectController("mt", "m1", {})
+        statuses = [parser._parse_mtconnect_status(document).snapshot() for _ in range(3)]
+        assert all(status.emergency_stop_active for status in statuses)
+
+        controller = _ScriptedController(statuses)
+        asyncio.run(controller._monitor_status())
+
+        assert controller.waits == [0.1, 5.0, 5.0]
+
+
+class _StubModbusResponse:
+    def __init__(self, registers=None):
+        self.registers = registers or []
+
+    def isError(self):
+        return self.registers is None or not self.registers
+
+
+class _StubModbusClient:
+    """Holding-register table answering reads with the pymodbus >= 3.10 signature."""
+
+    def __init__(self, registers):
+        self.registers = registers
+        self.reads = []
+
+    async def read_holding_registers(self, address, *, count=1, device_id=1, no_response_expected=False):
+        self.reads.append((address, count, device_id))
+        if any(address + i not in self.registers for i in range(count)):
+            return _StubModbusResponse()
+        return _StubModbusResponse([self.registers[address + i] for i in range(count)])
+
+    def close(self):
+        pass
+
+
+def register_words(fmt, value):
+    """Split a big-endian packed value into 16-bit holding registers."""
+    packed = struct.pack(fmt, value)
+    return list(struct.unpack(f">{len(packed) // 2}H", packed))
+
+
+class TestModbusController:
+    """Register reads are batched per contiguous range and decoded with struct."""
+
+    REGISTER_MAP = {
+        "execution": 100,
+        "feedrate": {"address": 101, "type": "float32"},
+        "spindle_speed": {"address": 103, "type": "int16", "scale": 10},
+        "position_X": {"address": 200, "type": "int32", "scale": 0.001},
+    }
+
+    def _controller(self, registers):
+        controller = ModbusController("mb", "m1", {
+            "unit_id": 3,
+            "register_map": self.REGISTER_MAP,
+            "execution_codes": {"1": "READY", "2": "ACTIVE"},
+        })
+        controller.client = _StubModbusClient(registers)
+        controller._unit_keyword = _modbus_unit_keyword(controller.client.read_holding_registers)
+        controller._plan_register_reads()
+        return controller
+
+    @pytest.mark.unit
+    def test_plan_reads_merges_contiguous_spans(self):
+        assert _plan_reads([(103, 1), (100, 1), (101, 2), (200, 2)]) == [(100, 4), (200, 2)]
+        assert _plan_reads([(10, 2), (11, 2)]) == [(10, 3)]
+        # A merge that would exceed the per-request limit starts a new read
+        assert _plan_reads([(0, 2), (2, 2)], max_count=3) == [(0, 2), (2, 2)]
+
+    @pytest.mark.unit
+    def test_unit_keyword_follows_client_signature(self):
+        async def legacy_read(address, count=1, slave=0, **kwargs):
+            pass
+
+        assert _modbus_unit_keyword(_StubModbusClient({}).read_holding_registers) == "device_id"
+        assert _modbus_unit_keyword(legacy_read) == "slave"
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_status_decoded_from_batched_reads(self):
+        registers = {100: 2}
+        registers.update(zip((101, 102), register_words(">f", 250.5)))
+        registers[103] = register_words(">h", 120)[0]
+        registers.update(zip((200, 201), register_words(">i", -12500)))
+        controller = self._controller(registers)
+
+        result = asyncio.run(controller.get_status())
+
+        assert result.success
+        assert controller.client.reads == [(100, 4, 3), (200, 2, 3)]
+        status = result.result
+        assert status.state == MachineState.ACTIVE
+        assert status.feedrate == 250.5
+        assert status.spindle_status.speed_rpm == 1200
+        assert status.axis_positions.axis("X") == pytest.approx(-12.5)
+
+    @pytest.mark.unit
+    @pytest.mark.cnc_integration
+    def test_failed_read_reports_error(self):
+        controller = self._controller({100: 1, 101: 0, 102: 0, 103: 0})  # axis block missing
+
+        result = asyncio.run(controller.get_status())
+
+        assert not result.success
+        assert result.error_code == "READ_ERROR"
+        assert "at 200" in result.error
+
+
+class TestRunEventLoop:
+    @pytest.mark.unit
+    def test_runs_coroutine_without_changing_loop_policy(self):
+        policy = asyncio.get_event_loop_policy()
+
+        async def answer():
+            await asyncio.sleep(0)
+            return 42
+
+        assert run_event_loop(answer()) == 42
+        assert asyncio.get_event_loop_policy() is policy